@@ -4,27 +4,38 @@ Mini SQL Engine - A lightweight SQL-like database management system.
 
 __version__ = "0.1.0"
 
-from .storage_manager import StorageManager
-from .models.column import Column
-from .models.schema import Schema
-from .models.row import Row
-from .models.table import Table
-from .ast_nodes import ASTNode, CreateTableNode, InsertNode, SelectNode, WhereClause
-from .parser import SQLParser
-from .exceptions import (
-    SQLEngineError,
-    ParseError,
-    ValidationError,
-    TableNotFoundError,
-    ColumnNotFoundError,
-    StorageError,
-    ProcessingError,
-    ExecutionError
-)
-from .query_processor import QueryProcessor, ExecutionPlan, Operation, CreateTableOperation
-from .execution_engine import ExecutionEngine, QueryResult
-from .sql_engine import SQLEngine
-from .cli import SQLShell
+import importlib
+
+# Public names and the submodule defining each; resolved on first access
+_LAZY = {
+    'StorageManager': '.storage_manager',
+    'Column': '.models.column',
+    'Schema': '.models.schema',
+    'Row': '.models.row',
+    'Table': '.models.table',
+    'ASTNode': '.ast_nodes',
+    'CreateTableNode': '.ast_nodes',
+    'InsertNode': '.ast_nodes',
+    'SelectNode': '.ast_nodes',
+    'WhereClause': '.ast_nodes',
+    'SQLParser': '.parser',
+    'QueryProcessor': '.query_processor',
+    'ExecutionPlan': '.query_processor',
+    'Operation': '.query_processor',
+    'CreateTableOperation': '.query_processor',
+    'ExecutionEngine': '.execution_engine',
+    'QueryResult': '.execution_engine',
+    'SQLEngine': '.sql_engine',
+    'SQLShell': '.cli',
+    'SQLEngineError': '.exceptions',
+    'ParseError': '.exceptions',
+    'ValidationError': '.exceptions',
+    'TableNotFoundError': '.exceptions',
+    'ColumnNotFoundError': '.exceptions',
+    'StorageError': '.exceptions',
+    'ProcessingError': '.exceptions',
+    'ExecutionError': '.exceptions',
+}
 
 __all__ = [
     'StorageManager',
@@ -54,4 +65,19 @@ __all__ = [
     'StorageError',
     'ProcessingError',
     'ExecutionError'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import a public name from its submodule on first access (PEP 562)."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List module attributes, including names not yet imported."""
+    return sorted(set(globals()) | set(__all__))
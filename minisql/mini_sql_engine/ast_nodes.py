@@ -6,23 +6,209 @@ Each node type corresponds to a specific SQL operation and contains the necessar
 information for query processing and execution.
 """
 
-from abc import ABC, abstractmethod
-from typing import List, Any, Optional
+import operator
+import sys
+from itertools import compress
+from typing import List, Any, Optional, Callable, Sequence, Mapping
 from .models.column import Column
 
 
-class ASTNode(ABC):
+# Column list of a SELECT COUNT(*) query; never a valid column name
+COUNT_ALL = 'COUNT(*)'
+
+# Comparison functions keyed by WHERE operator; also the set of valid operators
+_OP_TABLE: Mapping[str, Callable[[Any, Any], bool]] = {
+    '=': operator.eq,
+    '!=': operator.ne,
+    '<>': operator.ne,
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+}
+
+
+# Python comparison syntax for each WHERE operator, used by generated predicates
+_OP_SYNTAX = {
+    '=': '==',
+    '!=': '!=',
+    '<>': '!=',
+    '>': '>',
+    '<': '<',
+    '>=': '>=',
+    '<=': '<=',
+}
+
+# Literal types whose comparisons are safe to inline into generated code
+_SPECIALIZABLE_TYPES = (int, float, str, bool)
+
+_PREDICATE_TEMPLATE = """
+def make_predicate(_val):
+    def predicate(v):
+        if v is None:
+            return {null_result}
+        try:
+            return v {op} _val
+        except TypeError:
+            return False
+    return predicate
+"""
+
+# Generated predicate factories keyed by (operator, NULL result)
+_PREDICATE_FACTORIES = {}
+
+_SELECTOR_TEMPLATE = """
+def make_selector(_val):
+    def selector(column, start):
+        return [i for i, v in enumerate(column, start) if {test}]
+    return selector
+"""
+
+# Row test for each NULL result (None when the column has no NULLs), used by
+# generated column selectors, value filters and masks
+_SELECTOR_TESTS = {
+    False: 'v is not None and v {op} _val',
+    True: 'v is None or v {op} _val',
+    None: 'v {op} _val',  # NOT NULL columns: no NULL test needed
+}
+
+# Generated column selector factories keyed by (operator, NULL result)
+_SELECTOR_FACTORIES = {}
+
+_VALUE_FILTER_TEMPLATE = """
+def make_value_filter(_val):
+    def value_filter(column):
+        return [v for v in column if {test}]
+    return value_filter
+"""
+
+# Generated column value filter factories keyed by (operator, NULL result)
+_VALUE_FILTER_FACTORIES = {}
+
+_MASK_TEMPLATE = """
+def make_mask(_val):
+    def mask(column):
+        return [{test} for v in column]
+    return mask
+"""
+
+# Generated column mask factories keyed by (operator, NULL result)
+_MASK_FACTORIES = {}
+
+# Template, factory cache and factory name for each kind of generated column function
+_SPECIALIZATIONS = {
+    'selector': (_SELECTOR_TEMPLATE, _SELECTOR_FACTORIES, 'make_selector'),
+    'value_filter': (_VALUE_FILTER_TEMPLATE, _VALUE_FILTER_FACTORIES, 'make_value_filter'),
+    'mask': (_MASK_TEMPLATE, _MASK_FACTORIES, 'make_mask'),
+}
+
+
+def _safe(op: Callable[[Any, Any], bool], left: Any, right: Any) -> bool:
+    """Apply a comparison, treating incomparable types as a non-match."""
+    try:
+        return op(left, right)
+    except TypeError:
+        return False
+
+
+def _intern(name: Any) -> Any:
+    """Intern a table or column name so catalog and schema lookups hit by identity."""
+    return sys.intern(name) if type(name) is str else name
+
+
+def _specialized_predicate(operator: str, value: Any, null_result: bool) -> Callable[[Any], bool]:
+    """
+    Build a predicate with the comparison operator inlined as bytecode.
+    
+    The source for each (operator, null_result) pair is generated and compiled
+    once, then reused for every literal value.
+    """
+    key = (operator, null_result)
+    factory = _PREDICATE_FACTORIES.get(key)
+    if factory is None:
+        source = _PREDICATE_TEMPLATE.format(op=_OP_SYNTAX[operator], null_result=null_result)
+        factory = _PREDICATE_FACTORIES[key] = _compile_factory(source, operator, 'make_predicate')
+    return factory(value)
+
+
+def _specialize(kind: str, operator: str, value: Any, null_result: Optional[bool]) -> Callable:
+    """
+    Build a column function of the given kind with the condition inlined.
+    
+    Selectors return the matching positions in a column, value filters the
+    matching values, and masks one boolean per value. Each inlines the row
+    test into a single comprehension; like the predicates, the source is
+    compiled once per (operator, null_result) pair and reused for every
+    literal value.
+    
+    Args:
+        kind: 'selector', 'value_filter' or 'mask'
+        operator: The WHERE comparison operator
+        value: The literal to compare against
+        null_result: Result for NULL values, or None for NOT NULL columns
+        
+    Returns:
+        The generated function for the condition
+    """
+    template, factories, name = _SPECIALIZATIONS[kind]
+    key = (operator, null_result)
+    factory = factories.get(key)
+    if factory is None:
+        test = _SELECTOR_TESTS[null_result].format(op=_OP_SYNTAX[operator])
+        factory = factories[key] = _compile_factory(template.format(test=test), operator, name)
+    return factory(value)
+
+
+def _select_none(column: Sequence[Any], start: int) -> List[int]:
+    """Column selector for a condition that no value can satisfy."""
+    return []
+
+
+def _select_nulls(column: Sequence[Any], start: int) -> List[int]:
+    """Column selector matching the NULL values."""
+    return [i for i, v in enumerate(column, start) if v is None]
+
+
+def _select_non_nulls(column: Sequence[Any], start: int) -> List[int]:
+    """Column selector matching the non-NULL values."""
+    return [i for i, v in enumerate(column, start) if v is not None]
+
+
+# Column selectors for comparisons with a NULL literal, keyed by operator;
+# the ordering operators never match, so they fold to _select_none
+_NULL_LITERAL_SELECTORS = {
+    '=': _select_nulls,
+    '!=': _select_non_nulls,
+    '<>': _select_non_nulls,
+}
+
+
+def _compile_factory(source: str, operator: str, name: str) -> Callable:
+    """Compile generated source and return the factory function it defines."""
+    namespace = {}
+    exec(compile(source, f"<where {operator}>", "exec"), namespace)
+    return namespace[name]
+
+
+class ASTNode:
     """Base class for all AST nodes in the SQL parser."""
     
-    @abstractmethod
+    __slots__ = ()
+    
+    def __init__(self):
+        """Concrete node types define their own fields and do not call this."""
+        raise TypeError("ASTNode cannot be instantiated directly")
+    
     def accept(self, visitor):
         """Accept a visitor for processing this node (Visitor pattern)."""
-        pass
+        return getattr(visitor, _VISIT[type(self)])(self)
 
 
 class CreateTableNode(ASTNode):
     """AST node representing a CREATE TABLE statement."""
     
+    __slots__ = ('table_name', 'columns')
+    
     def __init__(self, table_name: str, columns: List[Column]):
         """
         Initialize CREATE TABLE node.
@@ -36,13 +222,9 @@ class CreateTableNode(ASTNode):
         if not columns:
             raise ValueError("Table must have at least one column")
         
-        self.table_name = table_name
+        self.table_name = _intern(table_name)
         self.columns = columns
     
-    def accept(self, visitor):
-        """Accept a visitor for processing this CREATE TABLE node."""
-        return visitor.visit_create_table(self)
-    
     def __repr__(self) -> str:
         return f"CreateTableNode(table_name='{self.table_name}', columns={len(self.columns)})"
 
@@ -50,6 +232,8 @@ class CreateTableNode(ASTNode):
 class InsertNode(ASTNode):
     """AST node representing an INSERT statement."""
     
+    __slots__ = ('table_name', 'values')
+    
     def __init__(self, table_name: str, values: List[Any]):
         """
         Initialize INSERT node.
@@ -63,13 +247,9 @@ class InsertNode(ASTNode):
         if not values:
             raise ValueError("INSERT must have at least one value")
         
-        self.table_name = table_name
+        self.table_name = _intern(table_name)
         self.values = values
     
-    def accept(self, visitor):
-        """Accept a visitor for processing this INSERT node."""
-        return visitor.visit_insert(self)
-    
     def __repr__(self) -> str:
         return f"InsertNode(table_name='{self.table_name}', values={len(self.values)})"
 
@@ -77,13 +257,16 @@ class InsertNode(ASTNode):
 class SelectNode(ASTNode):
     """AST node representing a SELECT statement."""
     
+    __slots__ = ('table_name', 'columns', 'where_clause')
+    
     def __init__(self, table_name: str, columns: List[str], where_clause: Optional['WhereClause'] = None):
         """
         Initialize SELECT node.
         
         Args:
             table_name: Name of the table to select from
-            columns: List of column names to select (use ['*'] for all columns)
+            columns: List of column names to select (use ['*'] for all columns,
+                or [COUNT_ALL] to count the matching rows)
             where_clause: Optional WHERE clause for filtering
         """
         if not table_name:
@@ -91,14 +274,10 @@ class SelectNode(ASTNode):
         if not columns:
             raise ValueError("SELECT must specify at least one column")
         
-        self.table_name = table_name
-        self.columns = columns
+        self.table_name = _intern(table_name)
+        self.columns = [_intern(c) for c in columns]
         self.where_clause = where_clause
     
-    def accept(self, visitor):
-        """Accept a visitor for processing this SELECT node."""
-        return visitor.visit_select(self)
-    
     def __repr__(self) -> str:
         where_info = f", where={self.where_clause}" if self.where_clause else ""
         return f"SelectNode(table_name='{self.table_name}', columns={self.columns}{where_info})"
@@ -107,8 +286,11 @@ class SelectNode(ASTNode):
 class WhereClause:
     """Represents a WHERE clause condition in a SELECT statement."""
     
+    __slots__ = ('column', 'operator', 'value', '_op', '_value_is_none', '_null_result', '_ne', '_pred',
+                 '_selector', '_value_filter', '_mask', '_not_null_selector', '_not_null_value_filter')
+    
     # Supported comparison operators
-    VALID_OPERATORS = {'=', '>', '<', '>=', '<=', '!=', '<>'}
+    VALID_OPERATORS = frozenset(_OP_TABLE)
     
     def __init__(self, column: str, operator: str, value: Any):
         """
@@ -121,12 +303,34 @@ class WhereClause:
         """
         if not column:
             raise ValueError("Column name cannot be empty")
-        if operator not in self.VALID_OPERATORS:
-            raise ValueError(f"Invalid operator '{operator}'. Must be one of {self.VALID_OPERATORS}")
+        self._op = _OP_TABLE.get(operator)
+        if self._op is None:
+            raise ValueError(f"Invalid operator '{operator}'. Must be one of {sorted(_OP_TABLE)}")
         
-        self.column = column
+        self.column = _intern(column)
         self.operator = operator
         self.value = value
+        
+        # Precompute NULL outcomes: NULL only ever matches via =, != and <>
+        self._ne = operator in ('!=', '<>')
+        self._value_is_none = value is None
+        self._null_result = (operator == '=') if self._value_is_none else self._ne
+        self._pred = self._build_predicate()
+        self._value_filter = None
+        self._mask = None
+        self._not_null_value_filter = None
+        if self._value_is_none:
+            self._selector = _NULL_LITERAL_SELECTORS.get(operator, _select_none)
+            self._not_null_selector = self._selector
+        elif type(value) in _SPECIALIZABLE_TYPES:
+            self._selector = _specialize('selector', operator, value, self._null_result)
+            self._value_filter = _specialize('value_filter', operator, value, self._null_result)
+            self._mask = _specialize('mask', operator, value, self._null_result)
+            self._not_null_selector = _specialize('selector', operator, value, None)
+            self._not_null_value_filter = _specialize('value_filter', operator, value, None)
+        else:
+            self._selector = None
+            self._not_null_selector = None
     
     def evaluate(self, row_value: Any) -> bool:
         """
@@ -138,30 +342,124 @@ class WhereClause:
         Returns:
             True if the condition is satisfied, False otherwise
         """
-        if row_value is None or self.value is None:
-            # Handle NULL comparisons
-            if self.operator in ('=', '!=', '<>'):
-                return (row_value is None) == (self.value is None) if self.operator == '=' else (row_value is None) != (self.value is None)
-            return False
+        return self._pred(row_value)
+    
+    def matches_nothing(self) -> bool:
+        """
+        Check whether no value can satisfy this condition.
         
-        try:
-            if self.operator == '=':
-                return row_value == self.value
-            elif self.operator in ('!=', '<>'):
-                return row_value != self.value
-            elif self.operator == '>':
-                return row_value > self.value
-            elif self.operator == '<':
-                return row_value < self.value
-            elif self.operator == '>=':
-                return row_value >= self.value
-            elif self.operator == '<=':
-                return row_value <= self.value
-        except TypeError:
-            # Handle type comparison errors (e.g., comparing string to int)
-            return False
+        True for ordering comparisons with NULL (e.g. age < NULL), which never
+        match; callers can then skip reading the column at all.
+        """
+        return self._selector is _select_none
+    
+    def compile(self) -> Callable[[Any], bool]:
+        """
+        Compile this condition into a predicate over a single row value.
         
-        return False
+        The predicate is built when the clause is constructed; for int, float,
+        str and bool literals it is generated code with the comparison inlined.
+        Callers filtering many rows should fetch it once and reuse it.
+        
+        Returns:
+            A function taking a row value and returning True if it matches
+        """
+        return self._pred
+    
+    def _build_predicate(self) -> Callable[[Any], bool]:
+        """Build the specialized predicate returned by compile()."""
+        null_result = self._null_result
+        
+        if self._value_is_none:
+            # NULL literal: the outcome depends only on whether v is NULL
+            non_null_result = self._ne
+            return lambda v: null_result if v is None else non_null_result
+        
+        if type(self.value) in _SPECIALIZABLE_TYPES:
+            return _specialized_predicate(self.operator, self.value, null_result)
+        
+        def predicate(v, val=self.value, op=self._op):
+            return null_result if v is None else _safe(op, v, val)
+        
+        return predicate
+    
+    def evaluate_mask(self, column: Sequence[Any]) -> List[bool]:
+        """
+        Evaluate this condition over a whole column of values at once.
+        
+        Uses a generated comprehension with the comparison inlined, falling
+        back to the per-value predicate when the column mixes incomparable types.
+        
+        Args:
+            column: The values of the WHERE column, one per row
+            
+        Returns:
+            A list of booleans, True where the row satisfies the condition
+        """
+        if self._selector is _select_none:
+            return [False] * len(column)
+        if self._mask is not None:
+            try:
+                return self._mask(column)
+            except TypeError:
+                pass
+        return list(map(self.compile(), column))
+    
+    def select(self, column: Sequence[Any], start: int = 0, nullable: bool = True) -> List[int]:
+        """
+        Find the positions of the values in a column that satisfy this condition.
+        
+        Uses a generated selector with the comparison inlined (or, for a NULL
+        literal, a fixed selector that only tests for NULL), falling back to
+        the per-value predicate when the column mixes incomparable types.
+        
+        Args:
+            column: The values of the WHERE column, one per row
+            start: Position of the column's first value, added to every result
+                so a slice of a larger column yields positions in the whole
+            nullable: False if the column cannot hold NULLs, so the generated
+                selector can skip its NULL test
+            
+        Returns:
+            The ascending row positions that match
+        """
+        selector = self._selector if nullable else self._not_null_selector
+        if selector is not None:
+            try:
+                return selector(column, start)
+            except TypeError:
+                pass
+        return list(compress(range(start, start + len(column)), map(self.compile(), column)))
+    
+    def filter_values(self, column: Sequence[Any], nullable: bool = True) -> List[Any]:
+        """
+        Find the values in a column that satisfy this condition.
+        
+        Equivalent to gathering the values at the positions select() returns,
+        without building the positions.
+        
+        Args:
+            column: The values of the WHERE column, one per row
+            nullable: False if the column cannot hold NULLs, as for select()
+            
+        Returns:
+            The matching values, in column order
+        """
+        value_filter = self._value_filter if nullable else self._not_null_value_filter
+        if value_filter is not None:
+            try:
+                return value_filter(column)
+            except TypeError:
+                pass
+        return list(compress(column, map(self.compile(), column)))
     
     def __repr__(self) -> str:
-        return f"WhereClause(column='{self.column}', operator='{self.operator}', value={self.value!r})"
\ No newline at end of file
+        return f"WhereClause(column='{self.column}', operator='{self.operator}', value={self.value!r})"
+
+
+# Visitor method for each concrete node type, used by ASTNode.accept
+_VISIT = {
+    CreateTableNode: 'visit_create_table',
+    InsertNode: 'visit_insert',
+    SelectNode: 'visit_select',
+}
@@ -6,10 +6,82 @@ command-line interface for executing SQL commands.
 """
 
 import sys
-from typing import Optional
+from typing import Optional, TextIO
 from .sql_engine import SQLEngine
 from .execution_engine import QueryResult
-from .exceptions import SQLEngineError
+from .exceptions import (
+    SQLEngineError,
+    ParseError,
+    ValidationError,
+    TableNotFoundError,
+    ColumnNotFoundError,
+    StorageError,
+    ProcessingError,
+    ExecutionError
+)
+
+
+# Message prefix shown for each kind of engine error
+_ERROR_LABELS = {
+    ParseError: 'Parse Error',
+    ValidationError: 'Validation Error',
+    TableNotFoundError: 'Table Error',
+    ColumnNotFoundError: 'Column Error',
+    StorageError: 'Storage Error',
+    ProcessingError: 'Processing Error',
+    ExecutionError: 'Execution Error',
+}
+
+# Shell commands, matched case-insensitively
+_EXIT_COMMANDS = frozenset({'exit', 'quit', 'exit;', 'quit;'})
+_HELP_COMMANDS = frozenset({'help', 'help;'})
+_SHOW_TABLES_COMMANDS = frozenset({'show tables', 'show tables;'})
+
+# Number of results buffered between writes when running a script
+_SCRIPT_FLUSH_INTERVAL = 64
+
+# Banner written once when the interactive shell starts
+_WELCOME = "Mini SQL Engine\nType 'help' for available commands, 'exit' or 'quit' to exit.\n\n"
+
+_HELP_TEXT = """
+Available Commands:
+  CREATE TABLE table_name (column1 type1, column2 type2, ...);
+    - Create a new table with specified columns and types
+    - Supported types: INT, VARCHAR, FLOAT, BOOLEAN
+    
+  INSERT INTO table_name VALUES (value1, value2, ...);
+    - Insert a new row into the specified table
+    
+  SELECT column1, column2, ... FROM table_name [WHERE condition];
+  SELECT * FROM table_name [WHERE condition];
+    - Select data from a table
+    - Use * to select all columns
+    - WHERE clause supports: =, >, <, >=, <=, !=
+    
+  SHOW TABLES;
+    - List all tables in the database
+    
+  HELP;
+    - Show this help message
+    
+  EXIT; or QUIT;
+    - Exit the SQL shell
+
+Examples:
+  CREATE TABLE users (id INT, name VARCHAR, age INT);
+  INSERT INTO users VALUES (1, 'Alice', 25);
+  SELECT * FROM users;
+  SELECT name, age FROM users WHERE age > 20;
+""".strip()
+
+
+def _error_label(error: SQLEngineError) -> str:
+    """Get the message prefix for an engine error, including its subclasses."""
+    for cls in type(error).__mro__:
+        label = _ERROR_LABELS.get(cls)
+        if label is not None:
+            return label
+    return 'SQL Error'
 
 
 class SQLShell:
@@ -51,6 +123,38 @@ class SQLShell:
         """Stop the SQL shell."""
         self.running = False
     
+    def run_script(self, stream: TextIO, output: Optional[TextIO] = None) -> None:
+        """
+        Execute commands read line by line from a non-interactive stream.
+        
+        Used when input is piped in: no welcome message or prompt is shown,
+        and results are written in batches rather than printed one by one.
+        
+        Args:
+            stream: Stream to read SQL commands from
+            output: Stream to write results to (defaults to sys.stdout)
+        """
+        if output is None:
+            output = sys.stdout
+        
+        self.running = True
+        pending = []
+        try:
+            for line in stream:
+                result = self.process_command(line)
+                if result:
+                    pending.append(result + "\n")
+                    if len(pending) >= _SCRIPT_FLUSH_INTERVAL:
+                        output.writelines(pending)
+                        pending.clear()
+                
+                if not self.running:
+                    break
+        finally:
+            output.writelines(pending)
+            output.flush()
+            self.running = False
+    
     def process_command(self, command: str) -> str:
         """
         Process a single SQL command and return the result as a string.
@@ -65,40 +169,28 @@ class SQLShell:
             return ""
         
         command = command.strip()
+        lowered = command.lower()
         
         # Handle exit commands
-        if command.lower() in ('exit', 'quit', 'exit;', 'quit;'):
+        if lowered in _EXIT_COMMANDS:
             self.stop()
             return "Goodbye!"
         
         # Handle help command
-        if command.lower() in ('help', 'help;'):
+        if lowered in _HELP_COMMANDS:
             return self._get_help_text()
         
         # Handle show tables command
-        if command.lower() in ('show tables', 'show tables;'):
+        if lowered in _SHOW_TABLES_COMMANDS:
             return self._show_tables()
         
         try:
-            # Execute SQL command
-            result = self.engine.execute_sql(command)
+            # Execute SQL command; the engine reuses plans for repeated commands
+            plan = self.engine.prepare(command)
+            result = self.engine.execute_plan(plan)
             return result.to_string()
-        except ParseError as e:
-            return f"Parse Error: {e.message}"
-        except ValidationError as e:
-            return f"Validation Error: {e.message}"
-        except TableNotFoundError as e:
-            return f"Table Error: {e.message}"
-        except ColumnNotFoundError as e:
-            return f"Column Error: {e.message}"
-        except StorageError as e:
-            return f"Storage Error: {e.message}"
-        except ProcessingError as e:
-            return f"Processing Error: {e.message}"
-        except ExecutionError as e:
-            return f"Execution Error: {e.message}"
         except SQLEngineError as e:
-            return f"SQL Error: {e.message}"
+            return f"{_error_label(e)}: {e.message}"
         except Exception as e:
             return f"Unexpected error: {e}"
     
@@ -151,9 +243,7 @@ class SQLShell:
     
     def _display_welcome(self) -> None:
         """Display welcome message."""
-        print("Mini SQL Engine")
-        print("Type 'help' for available commands, 'exit' or 'quit' to exit.")
-        print()
+        sys.stdout.write(_WELCOME)
     
     def _display_message(self, message: str) -> None:
         """Display a general message."""
@@ -165,37 +255,7 @@ class SQLShell:
     
     def _get_help_text(self) -> str:
         """Get help text for available commands."""
-        help_text = """
-Available Commands:
-  CREATE TABLE table_name (column1 type1, column2 type2, ...);
-    - Create a new table with specified columns and types
-    - Supported types: INT, VARCHAR, FLOAT, BOOLEAN
-    
-  INSERT INTO table_name VALUES (value1, value2, ...);
-    - Insert a new row into the specified table
-    
-  SELECT column1, column2, ... FROM table_name [WHERE condition];
-  SELECT * FROM table_name [WHERE condition];
-    - Select data from a table
-    - Use * to select all columns
-    - WHERE clause supports: =, >, <, >=, <=, !=
-    
-  SHOW TABLES;
-    - List all tables in the database
-    
-  HELP;
-    - Show this help message
-    
-  EXIT; or QUIT;
-    - Exit the SQL shell
-
-Examples:
-  CREATE TABLE users (id INT, name VARCHAR, age INT);
-  INSERT INTO users VALUES (1, 'Alice', 25);
-  SELECT * FROM users;
-  SELECT name, age FROM users WHERE age > 20;
-"""
-        return help_text.strip()
+        return _HELP_TEXT
     
     def _show_tables(self) -> str:
         """Show all tables in the database."""
@@ -204,10 +264,7 @@ Examples:
             if not tables:
                 return "No tables found."
             
-            result = "Tables:\n"
-            for table in tables:
-                result += f"  {table}\n"
-            return result.strip()
+            return "Tables:\n" + "\n".join(f"  {table}" for table in tables)
         except Exception as e:
             return f"Error listing tables: {e}"
 
@@ -228,7 +285,10 @@ def main():
     
     try:
         shell = SQLShell(args.data_dir)
-        shell.start()
+        if sys.stdin.isatty():
+            shell.start()
+        else:
+            shell.run_script(sys.stdin)
     except Exception as e:
         print(f"Failed to start SQL shell: {e}")
         sys.exit(1)
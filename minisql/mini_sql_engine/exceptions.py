@@ -13,8 +13,15 @@ class SQLEngineError(Exception):
     
     All SQL engine exceptions inherit from this class to provide a common
     interface for error handling.
+    
+    Subclasses declare their structured fields in __slots__, which serves
+    as the list of context fields (exceptions keep an instance __dict__
+    regardless, so this saves no memory). The context dictionary is built
+    from those fields on first access unless one is given or assigned.
     """
     
+    __slots__ = ('message', '_context')
+    
     def __init__(self, message: str, context: dict = None):
         """
         Initialize SQL engine error.
@@ -25,7 +32,23 @@ class SQLEngineError(Exception):
         """
         super().__init__(message)
         self.message = message
-        self.context = context or {}
+        self._context = context
+    
+    @property
+    def context(self) -> dict:
+        """Dictionary of the error's non-None context fields."""
+        if self._context is None:
+            self._context = {
+                name: getattr(self, name)
+                for cls in reversed(type(self).__mro__)
+                for name in cls.__dict__.get('__slots__', ())
+                if name[0] != '_' and name != 'message' and getattr(self, name, None) is not None
+            }
+        return self._context
+    
+    @context.setter
+    def context(self, context: dict) -> None:
+        self._context = context
     
     def __str__(self) -> str:
         """Return string representation of the error."""
@@ -40,6 +63,8 @@ class ParseError(SQLEngineError):
     unsupported commands, or malformed SQL statements.
     """
     
+    __slots__ = ('sql', 'position')
+    
     def __init__(self, message: str, sql: str = None, position: int = None):
         """
         Initialize parse error.
@@ -49,13 +74,7 @@ class ParseError(SQLEngineError):
             sql: The SQL statement that failed to parse (optional)
             position: Character position where error occurred (optional)
         """
-        context = {}
-        if sql is not None:
-            context['sql'] = sql
-        if position is not None:
-            context['position'] = position
-        
-        super().__init__(message, context)
+        super().__init__(message)
         self.sql = sql
         self.position = position
 
@@ -68,6 +87,8 @@ class ValidationError(SQLEngineError):
     type constraints, or other validation rules.
     """
     
+    __slots__ = ('table_name', 'column_name', 'value')
+    
     def __init__(self, message: str, table_name: str = None, column_name: str = None, value=None):
         """
         Initialize validation error.
@@ -78,15 +99,7 @@ class ValidationError(SQLEngineError):
             column_name: Name of the column where validation failed (optional)
             value: The value that failed validation (optional)
         """
-        context = {}
-        if table_name is not None:
-            context['table_name'] = table_name
-        if column_name is not None:
-            context['column_name'] = column_name
-        if value is not None:
-            context['value'] = value
-        
-        super().__init__(message, context)
+        super().__init__(message)
         self.table_name = table_name
         self.column_name = column_name
         self.value = value
@@ -100,6 +113,8 @@ class TableNotFoundError(SQLEngineError):
     a table that doesn't exist in the database.
     """
     
+    __slots__ = ('table_name',)
+    
     def __init__(self, message: str, table_name: str = None):
         """
         Initialize table not found error.
@@ -108,11 +123,7 @@ class TableNotFoundError(SQLEngineError):
             message: Description of the error
             table_name: Name of the table that was not found (optional)
         """
-        context = {}
-        if table_name is not None:
-            context['table_name'] = table_name
-        
-        super().__init__(message, context)
+        super().__init__(message)
         self.table_name = table_name
 
 
@@ -124,6 +135,8 @@ class ColumnNotFoundError(SQLEngineError):
     a column that doesn't exist in a table's schema.
     """
     
+    __slots__ = ('table_name', 'column_name')
+    
     def __init__(self, message: str, table_name: str = None, column_name: str = None):
         """
         Initialize column not found error.
@@ -133,13 +146,7 @@ class ColumnNotFoundError(SQLEngineError):
             table_name: Name of the table (optional)
             column_name: Name of the column that was not found (optional)
         """
-        context = {}
-        if table_name is not None:
-            context['table_name'] = table_name
-        if column_name is not None:
-            context['column_name'] = column_name
-        
-        super().__init__(message, context)
+        super().__init__(message)
         self.table_name = table_name
         self.column_name = column_name
 
@@ -152,6 +159,8 @@ class StorageError(SQLEngineError):
     or other storage-related operations fail.
     """
     
+    __slots__ = ('operation', 'filename')
+    
     def __init__(self, message: str, operation: str = None, filename: str = None):
         """
         Initialize storage error.
@@ -161,13 +170,7 @@ class StorageError(SQLEngineError):
             operation: The storage operation that failed (optional)
             filename: The filename involved in the operation (optional)
         """
-        context = {}
-        if operation is not None:
-            context['operation'] = operation
-        if filename is not None:
-            context['filename'] = filename
-        
-        super().__init__(message, context)
+        super().__init__(message)
         self.operation = operation
         self.filename = filename
 
@@ -180,6 +183,8 @@ class ProcessingError(SQLEngineError):
     an AST node into an executable query plan.
     """
     
+    __slots__ = ('ast_node_type',)
+    
     def __init__(self, message: str, ast_node_type: str = None):
         """
         Initialize processing error.
@@ -188,11 +193,7 @@ class ProcessingError(SQLEngineError):
             message: Description of the processing error
             ast_node_type: Type of AST node that failed processing (optional)
         """
-        context = {}
-        if ast_node_type is not None:
-            context['ast_node_type'] = ast_node_type
-        
-        super().__init__(message, context)
+        super().__init__(message)
         self.ast_node_type = ast_node_type
 
 
@@ -204,6 +205,8 @@ class ExecutionError(SQLEngineError):
     errors while executing query operations.
     """
     
+    __slots__ = ('operation_type', 'table_name')
+    
     def __init__(self, message: str, operation_type: str = None, table_name: str = None):
         """
         Initialize execution error.
@@ -213,13 +216,7 @@ class ExecutionError(SQLEngineError):
             operation_type: Type of operation that failed (optional)
             table_name: Name of the table involved (optional)
         """
-        context = {}
-        if operation_type is not None:
-            context['operation_type'] = operation_type
-        if table_name is not None:
-            context['table_name'] = table_name
-        
-        super().__init__(message, context)
+        super().__init__(message)
         self.operation_type = operation_type
         self.table_name = table_name
 
@@ -231,6 +228,8 @@ class DataTypeError(ValidationError):
     This is a specialized validation error for data type issues.
     """
     
+    __slots__ = ('expected_type', 'actual_type')
+    
     def __init__(self, message: str, expected_type: str = None, actual_type: str = None, 
                  value=None, column_name: str = None):
         """
@@ -246,11 +245,6 @@ class DataTypeError(ValidationError):
         super().__init__(message, column_name=column_name, value=value)
         self.expected_type = expected_type
         self.actual_type = actual_type
-        
-        if expected_type:
-            self.context['expected_type'] = expected_type
-        if actual_type:
-            self.context['actual_type'] = actual_type
 
 
 class SchemaError(ValidationError):
@@ -261,6 +255,8 @@ class SchemaError(ValidationError):
     schemas, or other schema-related issues.
     """
     
+    __slots__ = ('schema_issue',)
+    
     def __init__(self, message: str, table_name: str = None, schema_issue: str = None):
         """
         Initialize schema error.
@@ -272,9 +268,6 @@ class SchemaError(ValidationError):
         """
         super().__init__(message, table_name=table_name)
         self.schema_issue = schema_issue
-        
-        if schema_issue:
-            self.context['schema_issue'] = schema_issue
 
 
 class ConstraintError(ValidationError):
@@ -285,6 +278,8 @@ class ConstraintError(ValidationError):
     NOT NULL, unique constraints, or other data integrity rules.
     """
     
+    __slots__ = ('constraint_type',)
+    
     def __init__(self, message: str, constraint_type: str = None, 
                  table_name: str = None, column_name: str = None, value=None):
         """
@@ -298,7 +293,4 @@ class ConstraintError(ValidationError):
             value: The value that violated the constraint
         """
         super().__init__(message, table_name=table_name, column_name=column_name, value=value)
-        self.constraint_type = constraint_type
-        
-        if constraint_type:
-            self.context['constraint_type'] = constraint_type
\ No newline at end of file
+        self.constraint_type = constraint_type
\ No newline at end of file
@@ -5,11 +5,37 @@ This module provides the ExecutionEngine class that executes query plans
 and returns results.
 """
 
-from typing import Any, List, Iterator, Dict
+import csv
+import io
+from collections import OrderedDict
+from operator import itemgetter
+from typing import Any, List, Iterator, Dict, Optional, Sequence, Tuple, TextIO
+from .ast_nodes import COUNT_ALL
 from .query_processor import ExecutionPlan, Operation
 from .storage_manager import StorageManager
 from .models.row import Row
-from .exceptions import ExecutionError, StorageError, ValidationError, TableNotFoundError, ColumnNotFoundError
+from .exceptions import SQLEngineError, ExecutionError
+
+
+# WHERE literal types that equality filters can look up in a table's hash index
+_INDEXABLE_TYPES = (int, float, str, bool)
+
+
+def _format_float(value: float) -> str:
+    """Format floats with reasonable precision, dropping a zero fraction."""
+    if value == int(value):
+        return str(int(value))
+    return f"{value:.2f}"
+
+
+# Display formatter for each exact value type; other types use str()
+_FORMATTERS = {
+    type(None): lambda value: "NULL",
+    bool: lambda value: "true" if value else "false",
+    int: int.__repr__,
+    float: _format_float,
+    str: str.__str__,
+}
 
 
 class QueryResult:
@@ -25,12 +51,63 @@ class QueryResult:
             message: Success message (for DDL/DML operations)
         """
         self.columns = columns or []
-        self.rows = rows or []
+        self._rows = rows or []
+        # Column lists backing a columnar result until rows are first requested
+        self._column_data: Optional[List[List[Any]]] = None
         self.message = message
     
+    @classmethod
+    def from_columns(cls, columns: List[str], column_data: List[List[Any]]) -> 'QueryResult':
+        """
+        Create a data result backed by column lists rather than Row objects.
+        
+        Formatting and export read the columns directly; Row objects are only
+        built if the rows attribute is accessed.
+        
+        Args:
+            columns: List of column names
+            column_data: One list of values per column, all the same length
+            
+        Returns:
+            A QueryResult over the given columns
+        """
+        result = cls(columns=columns)
+        result._column_data = column_data
+        return result
+    
+    @property
+    def rows(self) -> List[Row]:
+        """Result rows, materialized on first access for columnar results."""
+        if self._column_data is not None:
+            self._rows = list(map(Row, zip(*self._column_data)))
+            self._column_data = None
+        return self._rows
+    
+    @rows.setter
+    def rows(self, rows: List[Row]) -> None:
+        self._rows = rows
+        self._column_data = None
+    
+    def iter_rows(self) -> Iterator[Row]:
+        """
+        Iterate the result rows, building each Row only as it is reached.
+        
+        Unlike the rows attribute, a columnar result is left columnar and no
+        list of all rows is kept, so a single pass holds one row at a time.
+        """
+        if self._column_data is not None:
+            return map(Row, zip(*self._column_data))
+        return iter(self._rows)
+    
+    def _iter_values(self) -> Iterator[Sequence[Any]]:
+        """Iterate the values of each result row without building Row objects."""
+        if self._column_data is not None:
+            return zip(*self._column_data)
+        return (row.values for row in self._rows)
+    
     def is_data_result(self) -> bool:
         """Check if this result contains data (SELECT result)."""
-        return bool(self.columns or self.rows)
+        return bool(self.columns or self.get_row_count())
     
     def is_message_result(self) -> bool:
         """Check if this result contains a message (DDL/DML result)."""
@@ -38,7 +115,9 @@ class QueryResult:
     
     def get_row_count(self) -> int:
         """Get the number of rows in the result."""
-        return len(self.rows)
+        if self._column_data is not None:
+            return len(self._column_data[0]) if self._column_data else 0
+        return len(self._rows)
     
     def get_column_count(self) -> int:
         """Get the number of columns in the result."""
@@ -49,10 +128,11 @@ class QueryResult:
         if self.is_message_result():
             return self.message
         
-        if not self.columns and not self.rows:
+        row_count = self.get_row_count()
+        if not self.columns and not row_count:
             return "No results."
         
-        if not self.rows:
+        if not row_count:
             if self.columns:
                 return f"Query executed successfully. Columns: {', '.join(self.columns)}\n(0 rows)"
             else:
@@ -62,122 +142,114 @@ class QueryResult:
     
     def _format_table(self) -> str:
         """Format the result as a properly aligned table."""
-        if not self.columns or not self.rows:
+        row_count = self.get_row_count()
+        if not self.columns or not row_count:
             return "No data to display."
         
-        # Calculate column widths
-        column_widths = self._calculate_column_widths()
-        
-        # Build the table
-        lines = []
-        
-        # Header row
-        header_parts = []
-        for i, col in enumerate(self.columns):
-            header_parts.append(f"{col:<{column_widths[i]}}")
-        lines.append(" | ".join(header_parts))
-        
-        # Separator line
-        separator_parts = []
-        for width in column_widths:
-            separator_parts.append("-" * width)
-        lines.append("-+-".join(separator_parts))
-        
-        # Data rows
-        for row in self.rows:
-            row_parts = []
-            row_values = row.to_list()
-            for i, value in enumerate(row_values):
-                formatted_value = self._format_value(value)
-                row_parts.append(f"{formatted_value:<{column_widths[i]}}")
-            lines.append(" | ".join(row_parts))
+        # Each cell is formatted exactly once and reused for width and output
+        cells, column_widths = self._format_cells()
+        
+        lines = [
+            " | ".join(map(str.ljust, self.columns, column_widths)),
+            "-+-".join(["-" * width for width in column_widths]),
+        ]
+        lines.extend([" | ".join(map(str.ljust, row_cells, column_widths)) for row_cells in cells])
         
         # Add row count
         lines.append("")
-        lines.append(f"({len(self.rows)} row{'s' if len(self.rows) != 1 else ''})")
+        lines.append(f"({row_count} row{'s' if row_count != 1 else ''})")
         
         return "\n".join(lines)
     
-    def _calculate_column_widths(self) -> List[int]:
-        """Calculate the optimal width for each column."""
-        if not self.columns:
-            return []
+    def _format_cells(self) -> Tuple[List[Sequence[str]], List[int]]:
+        """
+        Format every cell and compute the column widths in one pass over the data.
+        
+        Returns:
+            A tuple of the formatted cells (one sequence of strings per row) and
+            the display width of each column
+        """
+        format_value = self._format_value
+        if self._column_data is not None:
+            formatted = [list(map(format_value, column)) for column in self._column_data]
+            cells = list(zip(*formatted))
+        else:
+            cells = [list(map(format_value, row.values)) for row in self._rows]
+            formatted = list(zip(*cells))
         
         # Start with column header lengths
         widths = [len(col) for col in self.columns]
-        
-        # Check each row to find maximum width needed
-        for row in self.rows:
-            row_values = row.to_list()
-            for i, value in enumerate(row_values):
-                if i < len(widths):  # Safety check
-                    formatted_value = self._format_value(value)
-                    widths[i] = max(widths[i], len(formatted_value))
+        for i, texts in enumerate(formatted):
+            if i < len(widths) and texts:  # Safety check
+                widths[i] = max(widths[i], max(map(len, texts)))
         
         # Set minimum width of 3 for readability
-        return [max(width, 3) for width in widths]
+        return cells, [max(width, 3) for width in widths]
+    
+    def _calculate_column_widths(self) -> List[int]:
+        """Calculate the optimal width for each column."""
+        if not self.columns:
+            return []
+        return self._format_cells()[1]
     
     def _format_value(self, value: Any) -> str:
         """Format a single value for display."""
-        if value is None:
-            return "NULL"
-        elif isinstance(value, bool):
-            return "true" if value else "false"
-        elif isinstance(value, float):
-            # Format floats with reasonable precision
-            if value == int(value):
-                return str(int(value))
-            else:
-                return f"{value:.2f}"
-        elif isinstance(value, str):
-            return value
-        else:
-            return str(value)
+        return _FORMATTERS.get(type(value), str)(value)
     
     def to_csv(self) -> str:
         """Convert result to CSV format."""
-        if not self.is_data_result() or not self.rows:
-            return ""
+        buffer = io.StringIO()
+        self.write_csv(buffer)
+        return buffer.getvalue()[:-1]  # Drop the final line terminator
+    
+    def write_csv(self, fh: TextIO) -> None:
+        """
+        Stream the result as CSV to a text file object, one row at a time.
+        
+        Values are formatted as for display and quoted by the csv module
+        when they contain commas, quotes or line breaks.
         
-        lines = []
+        Args:
+            fh: Writable text file object, e.g. sys.stdout
+        """
+        if not self.get_row_count():
+            return
+        
+        writer = csv.writer(fh, lineterminator="\n")
         
         # Header
         if self.columns:
-            lines.append(",".join(self.columns))
-        
-        # Data rows
-        for row in self.rows:
-            row_values = []
-            for value in row.to_list():
-                formatted_value = self._format_value(value)
-                # Escape commas and quotes in CSV
-                if "," in formatted_value or '"' in formatted_value:
-                    formatted_value = f'"{formatted_value.replace('"', '""')}"'
-                row_values.append(formatted_value)
-            lines.append(",".join(row_values))
+            writer.writerow(self.columns)
         
-        return "\n".join(lines)
+        # Data rows; columnar results are formatted column-at-a-time, lazily
+        format_value = self._format_value
+        if self._column_data is not None:
+            writer.writerows(zip(*[map(format_value, column) for column in self._column_data]))
+        else:
+            writer.writerows(map(format_value, values) for values in self._iter_values())
     
     def to_json(self) -> List[Dict[str, Any]]:
         """Convert result to JSON-compatible list of dictionaries."""
-        if not self.is_data_result() or not self.rows:
-            return []
+        return list(self.iter_json_records())
+    
+    def iter_json_records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the result rows one at a time as JSON-compatible dictionaries.
         
-        result = []
-        for row in self.rows:
-            row_dict = {}
-            row_values = row.to_list()
-            for i, col in enumerate(self.columns):
-                if i < len(row_values):
-                    row_dict[col] = row_values[i]
-            result.append(row_dict)
+        Returns:
+            An iterator of dicts mapping column names to row values
+        """
+        if not self.get_row_count():
+            return
         
-        return result
+        columns = self.columns
+        for values in self._iter_values():
+            yield dict(zip(columns, values))
     
     def __repr__(self) -> str:
         if self.is_message_result():
             return f"QueryResult(message='{self.message}')"
-        return f"QueryResult(columns={len(self.columns)}, rows={len(self.rows)})"
+        return f"QueryResult(columns={len(self.columns)}, rows={self.get_row_count()})"
     
     def __str__(self) -> str:
         return self.to_string()
@@ -196,6 +268,12 @@ class ExecutionEngine:
             storage_manager: The storage manager to use for data operations
         """
         self.storage_manager = storage_manager
+        # SELECT (table version, column names, column lists) keyed by operation
+        # reprs; one entry per query, so a result outdated by a table change is
+        # replaced. Names are kept as a tuple and each hit wraps them, as a new
+        # list, in a new QueryResult, so callers never share a result or its names
+        self._result_cache: "OrderedDict[Tuple[str, ...], Tuple[int, Tuple[str, ...], List[List[Any]]]]" = OrderedDict()
+        self._result_cache_max = 128
     
     def execute(self, plan: ExecutionPlan) -> QueryResult:
         """
@@ -230,12 +308,16 @@ class ExecutionEngine:
             
             return result if result else QueryResult(message="Operation completed successfully.")
             
-        except (StorageError, ValidationError, TableNotFoundError, ColumnNotFoundError, ProcessingError) as e:
+        except SQLEngineError:
             # Re-raise SQL engine errors as-is to preserve error types
             raise
         except Exception as e:
             raise ExecutionError(f"Failed to execute query plan: {e}")
     
+    def clear_cache(self) -> None:
+        """Discard all cached SELECT results."""
+        self._result_cache.clear()
+    
     def execute_operation(self, operation: Operation) -> QueryResult:
         """
         Execute a single operation.
@@ -253,16 +335,15 @@ class ExecutionEngine:
             result = operation.execute(self.storage_manager)
             
             # Convert operation result to QueryResult
-            if isinstance(result, str):
+            if operation.returns_rows:
+                # Materialize the rows (for SELECT operations)
+                return QueryResult(rows=list(result))
+            elif isinstance(result, str):
                 return QueryResult(message=result)
-            elif isinstance(result, Iterator):
-                # Convert iterator to list of rows (for SELECT operations)
-                rows = list(result)
-                return QueryResult(rows=rows)
             else:
                 return QueryResult(message=str(result))
                 
-        except (StorageError, ValidationError, TableNotFoundError, ColumnNotFoundError, ProcessingError) as e:
+        except SQLEngineError:
             # Re-raise SQL engine errors as-is to preserve error types
             raise
         except Exception as e:
@@ -284,6 +365,7 @@ class ExecutionEngine:
             scan_op = None
             filter_op = None
             project_op = None
+            count_op = None
             table_name = None
             
             for op in operations:
@@ -294,35 +376,160 @@ class ExecutionEngine:
                     filter_op = op
                 elif op.__class__.__name__ == 'ProjectOperation':
                     project_op = op
+                elif op.__class__.__name__ == 'CountOperation':
+                    count_op = op
             
             if not scan_op:
                 raise ExecutionError("No ScanOperation found in SELECT query")
-            if not project_op:
+            if not project_op and not count_op:
                 raise ExecutionError("No ProjectOperation found in SELECT query")
             
-            # Execute scan operation
-            rows = scan_op.execute(self.storage_manager)
-            
-            # Execute filter operation if present
-            if filter_op:
-                rows = filter_op.execute(self.storage_manager, input_rows=rows, table_name=table_name)
-            
-            # Execute project operation
-            projected_rows = project_op.execute(self.storage_manager, input_rows=rows, table_name=table_name)
+            # Any insert or clear bumps the table version, invalidating the entry
+            table = self.storage_manager.get_table(table_name)
+            cache_key = tuple(map(repr, operations))
+            cached = self._result_cache.get(cache_key)
+            if cached is not None and cached[0] == table.version:
+                self._result_cache.move_to_end(cache_key)
+                return QueryResult.from_columns(list(cached[1]), cached[2])
             
-            # Get column names for result
-            if len(project_op.columns) == 1 and project_op.columns[0] == '*':
-                # SELECT * - use all column names
-                table = self.storage_manager.get_table(table_name)
-                column_names = table.get_column_names()
+            if project_op is None:
+                # SELECT COUNT(*): count the matching rows without gathering them
+                column_names = [COUNT_ALL]
+                projected_columns = [[self._count_selected(scan_op, filter_op)]]
             else:
-                # Use specified column names
-                column_names = project_op.columns
+                projected_columns = self._execute_select_vectorized(scan_op, filter_op, project_op)
+                
+                # Get column names for result
+                if len(project_op.columns) == 1 and project_op.columns[0] == '*':
+                    # SELECT * - use all column names
+                    column_names = table.get_column_names()
+                else:
+                    # Use specified column names, copied so the result never
+                    # shares the list held by a cached AST and plan
+                    column_names = list(project_op.columns)
             
-            return QueryResult(columns=column_names, rows=projected_rows)
+            self._result_cache[cache_key] = (table.version, tuple(column_names), projected_columns)
+            self._result_cache.move_to_end(cache_key)
+            if len(self._result_cache) > self._result_cache_max:
+                self._result_cache.popitem(last=False)
+            return QueryResult.from_columns(column_names, projected_columns)
             
-        except (StorageError, ValidationError, TableNotFoundError, ColumnNotFoundError) as e:
+        except SQLEngineError:
             # Re-raise SQL engine errors as-is to preserve error types
             raise
         except Exception as e:
-            raise ExecutionError(f"Failed to execute SELECT operations: {e}")
\ No newline at end of file
+            raise ExecutionError(f"Failed to execute SELECT operations: {e}")
+    
+    def _count_selected(self, scan_op: Operation, filter_op: Optional[Operation]) -> int:
+        """
+        Count the rows a SELECT would return, without gathering any of them.
+        
+        Args:
+            scan_op: The ScanOperation naming the table
+            filter_op: The FilterOperation, or None if there is no WHERE clause
+            
+        Returns:
+            The number of matching rows
+        """
+        table_name = scan_op.table_name
+        table = self.storage_manager.get_table(table_name)
+        if filter_op is None:
+            return len(table)
+        
+        schema = table.schema
+        where_index = filter_op.column_index(schema, table_name)
+        where_clause = filter_op.where_clause
+        if where_clause.matches_nothing():
+            return 0
+        if where_clause.operator == '=' and type(where_clause.value) in _INDEXABLE_TYPES:
+            return len(table.equal_positions(where_index, where_clause.value))
+        
+        nullable = schema.columns[where_index].nullable
+        return sum(len(where_clause.filter_values(batch.columns[0], nullable))
+                   for batch in scan_op.execute_batched(self.storage_manager, [where_index]))
+    
+    def _execute_select_vectorized(self, scan_op: Operation, filter_op: Optional[Operation],
+                                   project_op: Operation) -> List[List[Any]]:
+        """
+        Run scan -> filter -> project as one fused pass over the table's columns.
+        
+        Only the WHERE column is scanned in RecordBatch objects. For each
+        batch the condition is evaluated into a selection vector of row
+        positions, and the projected values are gathered at those positions
+        straight from table storage into the output columns, so projected
+        columns are never copied into intermediate batches. Equality
+        conditions skip the scan and take their positions from the table's
+        hash index on the WHERE column. When only the WHERE column is
+        projected, its matching values are kept directly. Without a WHERE
+        clause each projected column is copied once. No Row objects are
+        created here.
+        
+        Args:
+            scan_op: The ScanOperation naming the table
+            filter_op: The FilterOperation, or None if there is no WHERE clause
+            project_op: The ProjectOperation listing the output columns
+            
+        Returns:
+            One list of result values per projected column
+        """
+        table_name = scan_op.table_name
+        table = self.storage_manager.get_table(table_name)
+        schema = table.schema
+        
+        # Resolve referenced columns first so unknown columns fail even on empty tables
+        if filter_op is not None:
+            where_index = filter_op.column_index(schema, table_name)
+        column_indices = project_op.column_indices(schema, table_name)
+        
+        columns = list(table.scan_columns().values())
+        projected = [columns[i] for i in column_indices]
+        if filter_op is None:
+            return [column[:] for column in projected]
+        
+        where_clause = filter_op.where_clause
+        if where_clause.matches_nothing():
+            return [[] for _ in projected]
+        
+        if where_clause.operator == '=' and type(where_clause.value) in _INDEXABLE_TYPES:
+            # Equality filters look their rows up in the column's hash index
+            selection = table.equal_positions(where_index, where_clause.value)
+            if len(selection) > 1:
+                gather = itemgetter(*selection)
+                return [list(gather(column)) for column in projected]
+            return [[column[position] for position in selection] for column in projected]
+        
+        batches = scan_op.execute_batched(self.storage_manager, [where_index])
+        nullable = schema.columns[where_index].nullable
+        
+        if column_indices == [where_index]:
+            # Only the WHERE column is projected: keep its matching values
+            # directly instead of gathering them by position
+            values = []
+            for batch in batches:
+                values += where_clause.filter_values(batch.columns[0], nullable)
+            return [values]
+        
+        output = [[] for _ in projected]
+        for batch in batches:
+            selection = where_clause.select(batch.columns[0], batch.offset, nullable)
+            if not selection:
+                continue
+            
+            if len(selection) == batch.num_rows:
+                stop = batch.offset + batch.num_rows
+                for out_column, column in zip(output, projected):
+                    out_column += column[batch.offset:stop]
+                continue
+            
+            if len(selection) == 1:
+                position = selection[0]
+                for out_column, column in zip(output, projected):
+                    out_column.append(column[position])
+                continue
+            
+            # One itemgetter gathers every selected position in a single C call
+            gather = itemgetter(*selection)
+            for out_column, column in zip(output, projected):
+                out_column += gather(column)
+        
+        return output
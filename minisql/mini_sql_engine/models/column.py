@@ -2,8 +2,107 @@
 Column data model for the Mini SQL Engine.
 """
 
-from dataclasses import dataclass
-from typing import Optional, Any
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Optional, Any, Callable, Dict, List, Sequence
+
+
+# VARCHAR values up to this length are shared through the column's dictionary
+_DICTIONARY_MAX_LENGTH = 64
+
+# Distinct values kept per column dictionary; beyond this, new values are stored as-is
+_DICTIONARY_MAX_SIZE = 4096
+
+
+def _validate_int(column: 'Column', value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _validate_float(column: 'Column', value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _validate_varchar(column: 'Column', value: Any) -> bool:
+    return isinstance(value, str) and len(value) <= (column.max_length or 255)
+
+
+def _validate_boolean(column: 'Column', value: Any) -> bool:
+    return isinstance(value, bool)
+
+
+def _convert_int(column: 'Column', value: Any) -> int:
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"Cannot convert non-integer float {value} to INT")
+    return int(value)
+
+
+def _convert_float(column: 'Column', value: Any) -> float:
+    return float(value)
+
+
+def _convert_varchar(column: 'Column', value: Any) -> str:
+    str_value = str(value)
+    if len(str_value) > (column.max_length or 255):
+        raise ValueError(f"String too long for column {column.name}")
+    
+    # Repeated short values share one string object (dictionary encoding)
+    dictionary = column._dictionary
+    if dictionary is not None and len(str_value) <= _DICTIONARY_MAX_LENGTH:
+        shared = dictionary.get(str_value)
+        if shared is not None:
+            return shared
+        if len(dictionary) < _DICTIONARY_MAX_SIZE:
+            dictionary[str_value] = str_value
+    return str_value
+
+
+def _share_strings(dictionary: Dict[str, str], values: Sequence[str]) -> List[str]:
+    """
+    Dictionary-encode a batch of strings, as _convert_varchar does one at a time.
+    
+    New short values are added in first-seen order while the dictionary has
+    room; the batch is then mapped through it in C, so each value costs a
+    dict lookup instead of a converter call.
+    """
+    for value in dict.fromkeys(values):
+        if value not in dictionary and len(value) <= _DICTIONARY_MAX_LENGTH:
+            if len(dictionary) >= _DICTIONARY_MAX_SIZE:
+                break
+            dictionary[value] = value
+    return list(map(dictionary.get, values, values))
+
+
+def _convert_boolean(column: 'Column', value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.lower() in ('true', '1', 'yes', 'on')
+    return bool(value)
+
+
+# Non-NULL value validator for each data type
+_VALIDATORS = {
+    'INT': _validate_int,
+    'FLOAT': _validate_float,
+    'VARCHAR': _validate_varchar,
+    'BOOLEAN': _validate_boolean,
+}
+
+# Python type stored for each non-VARCHAR data type; values already of
+# exactly this type convert to themselves
+_STORED_TYPES = {
+    'INT': int,
+    'FLOAT': float,
+    'BOOLEAN': bool,
+}
+
+# Non-NULL value converter for each data type
+_CONVERTERS = {
+    'INT': _convert_int,
+    'FLOAT': _convert_float,
+    'VARCHAR': _convert_varchar,
+    'BOOLEAN': _convert_boolean,
+}
 
 
 @dataclass
@@ -14,6 +113,10 @@ class Column:
     data_type: str  # 'INT', 'VARCHAR', 'FLOAT', 'BOOLEAN'
     nullable: bool = True
     max_length: Optional[int] = None
+    _validate: Callable[['Column', Any], bool] = field(init=False, repr=False, compare=False)
+    _convert: Callable[['Column', Any], Any] = field(init=False, repr=False, compare=False)
+    # None when dictionary encoding is turned off for this column
+    _dictionary: Optional[Dict[str, str]] = field(init=False, repr=False, compare=False, default_factory=dict)
     
     def __post_init__(self):
         """Validate column properties after initialization."""
@@ -29,24 +132,34 @@ class Column:
         
         if self.max_length is not None and self.max_length <= 0:
             raise ValueError("max_length must be positive")
+        
+        # Select the type-specific handlers once instead of per value
+        self._validate = _VALIDATORS[self.data_type]
+        self._convert = _CONVERTERS[self.data_type]
+    
+    @property
+    def dictionary_encoded(self) -> bool:
+        """Whether repeated values of this VARCHAR column share one string object."""
+        return self.data_type == 'VARCHAR' and self._dictionary is not None
+    
+    def set_dictionary_encoding(self, enabled: bool) -> None:
+        """
+        Turn sharing of repeated VARCHAR values on or off.
+        
+        Turning it off drops the dictionary, so a column of mostly distinct
+        values stops paying for lookups and stops keeping a copy of each value.
+        Values already stored are unaffected either way.
+        """
+        if not enabled:
+            self._dictionary = None
+        elif self._dictionary is None:
+            self._dictionary = {}
     
     def validate_value(self, value: Any) -> bool:
         """Validate if a value is compatible with this column's type and constraints."""
         if value is None:
             return self.nullable
-        
-        if self.data_type == 'INT':
-            return isinstance(value, int) and not isinstance(value, bool)
-        elif self.data_type == 'FLOAT':
-            return isinstance(value, (int, float)) and not isinstance(value, bool)
-        elif self.data_type == 'VARCHAR':
-            if not isinstance(value, str):
-                return False
-            return len(value) <= (self.max_length or 255)
-        elif self.data_type == 'BOOLEAN':
-            return isinstance(value, bool)
-        
-        return False
+        return self._validate(self, value)
     
     def convert_value(self, value: Any) -> Any:
         """Convert a value to the appropriate type for this column."""
@@ -56,24 +169,42 @@ class Column:
             return None
         
         try:
-            if self.data_type == 'INT':
-                if isinstance(value, float) and not value.is_integer():
-                    raise ValueError(f"Cannot convert non-integer float {value} to INT")
-                return int(value)
-            elif self.data_type == 'FLOAT':
-                return float(value)
-            elif self.data_type == 'VARCHAR':
-                str_value = str(value)
-                if len(str_value) > (self.max_length or 255):
-                    raise ValueError(f"String too long for column {self.name}")
-                return str_value
-            elif self.data_type == 'BOOLEAN':
-                if isinstance(value, bool):
-                    return value
-                if isinstance(value, str):
-                    return value.lower() in ('true', '1', 'yes', 'on')
-                return bool(value)
+            return self._convert(self, value)
         except (ValueError, TypeError) as e:
             raise ValueError(f"Cannot convert value {value} to {self.data_type} for column {self.name}: {e}")
+    
+    def convert_values(self, values: Sequence[Any]) -> List[Any]:
+        """
+        Convert a whole column of values, as convert_value does for one.
+        
+        Values that all already have the column's stored type (e.g. ints for
+        an INT column) are copied as they are, and strings that all fit a
+        VARCHAR column are shared through its dictionary in one pass.
+        Otherwise, without NULLs the type converter is mapped over the values
+        directly, skipping the per-value NULL check and error handling.
+        
+        Args:
+            values: The values to convert
+            
+        Returns:
+            The converted values, in order
+            
+        Raises:
+            ValueError: If any value cannot be converted
+        """
+        stored_type = _STORED_TYPES.get(self.data_type)
+        if stored_type is not None and set(map(type, values)) <= {stored_type}:
+            return list(values)
+        
+        if self.data_type == 'VARCHAR' and set(map(type, values)) <= {str}:
+            if max(map(len, values), default=0) <= (self.max_length or 255):
+                if self._dictionary is None:
+                    return list(values)
+                return _share_strings(self._dictionary, values)
         
-        return value
\ No newline at end of file
+        if None not in values:
+            try:
+                return list(map(partial(self._convert, self), values))
+            except (ValueError, TypeError):
+                pass  # Redo value by value to report the offending value
+        return list(map(self.convert_value, values))
@@ -9,15 +9,27 @@ from .schema import Schema
 class Row:
     """Represents a database table row with values."""
     
+    __slots__ = ('values',)
+    
     def __init__(self, values: List[Any]):
-        """Initialize row with a list of values."""
-        self.values = list(values)  # Create a copy to avoid mutation
+        """
+        Initialize row with a list of values.
+        
+        A list is taken over as-is rather than copied, so the row owns it from
+        here on; callers that need to keep using their list should pass a copy
+        or call copy() on the row. Other sequences are converted to a list.
+        """
+        self.values = values if type(values) is list else list(values)
     
     def get_value(self, column_index: int) -> Any:
         """Get value by column index."""
-        if column_index < 0 or column_index >= len(self.values):
-            raise IndexError(f"Column index {column_index} out of range")
-        return self.values[column_index]
+        # The list already bounds-checks the upper end in C; only reject negatives here
+        if column_index >= 0:
+            try:
+                return self.values[column_index]
+            except IndexError:
+                pass
+        raise IndexError(f"Column index {column_index} out of range")
     
     def get_value_by_name(self, column_name: str, schema: Schema) -> Any:
         """Get value by column name using schema."""
@@ -26,9 +38,13 @@ class Row:
     
     def set_value(self, column_index: int, value: Any) -> None:
         """Set value by column index."""
-        if column_index < 0 or column_index >= len(self.values):
-            raise IndexError(f"Column index {column_index} out of range")
-        self.values[column_index] = value
+        if column_index >= 0:
+            try:
+                self.values[column_index] = value
+                return
+            except IndexError:
+                pass
+        raise IndexError(f"Column index {column_index} out of range")
     
     def set_value_by_name(self, column_name: str, value: Any, schema: Schema) -> None:
         """Set value by column name using schema."""
@@ -58,7 +74,7 @@ class Row:
     
     def copy(self) -> 'Row':
         """Create a copy of this row."""
-        return Row(self.values)
+        return Row(list(self.values))
     
     def __len__(self) -> int:
         """Return number of values in row."""
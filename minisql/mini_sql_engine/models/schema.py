@@ -2,14 +2,34 @@
 Schema data model for the Mini SQL Engine.
 """
 
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Callable
 from .column import Column
 from ..exceptions import ValidationError
 
 
+# Most extra name spellings (e.g. 'AGE' for 'age') remembered per schema
+_SPELLING_CACHE_MAX = 256
+
+
+def _compile_row_converter(columns: List[Column]) -> Callable[..., List[Any]]:
+    """
+    Generate a function that converts one row's values positionally.
+    
+    The function takes one argument per column and applies that column's
+    converter to it, with no per-value loop or zip.
+    """
+    params = ', '.join(f"v{i}" for i in range(len(columns)))
+    items = ', '.join(f"c{i}(v{i})" for i in range(len(columns)))
+    namespace = {f"c{i}": column.convert_value for i, column in enumerate(columns)}
+    exec(compile(f"def convert_row({params}):\n    return [{items}]\n", "<convert_row>", "exec"), namespace)
+    return namespace['convert_row']
+
+
 class Schema:
     """Represents a database table schema with columns and validation."""
     
+    __slots__ = ('columns', '_column_index', '_column_index_exact', '_convert_row')
+    
     def __init__(self, columns: List[Column]):
         """Initialize schema with a list of columns."""
         if not columns:
@@ -22,6 +42,10 @@ class Schema:
         
         self.columns = columns
         self._column_index = {col.name.lower(): i for i, col in enumerate(columns)}
+        # Names as declared plus spellings already resolved, so repeated
+        # lookups skip the lower() call
+        self._column_index_exact = {col.name: i for i, col in enumerate(columns)}
+        self._convert_row = _compile_row_converter(columns)
     
     def get_column_names(self) -> List[str]:
         """Get list of column names."""
@@ -29,16 +53,24 @@ class Schema:
     
     def get_column_by_name(self, name: str) -> Column:
         """Get column by name (case-insensitive)."""
-        index = self._column_index.get(name.lower())
-        if index is None:
-            raise ValidationError(f"Column '{name}' not found in schema")
-        return self.columns[index]
+        return self.columns[self.get_column_index(name)]
     
     def get_column_index(self, name: str) -> int:
-        """Get column index by name (case-insensitive)."""
+        """
+        Get column index by name (case-insensitive).
+        
+        A name that only matches case-insensitively is remembered under its
+        own spelling, so repeated lookups with that spelling are one dict hit.
+        """
+        index = self._column_index_exact.get(name)
+        if index is not None:
+            return index
+        
         index = self._column_index.get(name.lower())
         if index is None:
             raise ValidationError(f"Column '{name}' not found in schema")
+        if len(self._column_index_exact) < len(self.columns) + _SPELLING_CACHE_MAX:
+            self._column_index_exact[name] = index
         return index
     
     def validate_row(self, values: List[Any]) -> bool:
@@ -57,19 +89,18 @@ class Schema:
         if len(values) != len(self.columns):
             raise ValidationError(f"Expected {len(self.columns)} values, got {len(values)}")
         
-        converted_values = []
-        for value, column in zip(values, self.columns):
-            converted_values.append(column.convert_value(value))
-        
-        return converted_values
+        return self._convert_row(*values)
     
     def validate_and_convert_row(self, values: List[Any]) -> List[Any]:
-        """Validate and convert a row of values."""
+        """
+        Validate and convert a row of values.
+        
+        Conversion is the validation: every column converter either returns
+        a value of the column's type within its constraints or raises, so the
+        converted row is not checked again.
+        """
         try:
-            converted = self.convert_row(values)
-            if not self.validate_row(converted):
-                raise ValidationError("Row validation failed after conversion")
-            return converted
+            return self.convert_row(values)
         except Exception as e:
             raise ValidationError(f"Row validation failed: {e}")
     
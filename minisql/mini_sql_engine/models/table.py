@@ -2,14 +2,34 @@
 Table data model for the Mini SQL Engine.
 """
 
-from typing import List, Iterator, Any, Dict, Optional
+from collections import defaultdict
+from itertools import compress, count, islice
+from typing import List, Iterator, Any, Dict, Optional, Tuple
 from .schema import Schema
 from .row import Row
 from ..exceptions import ValidationError
 
 
+# Source of table versions; unique across all tables so a dropped and
+# recreated table never reuses a version
+_VERSIONS = count()
+
+# Row count at which a table first profiles its columns (see Table.analyze)
+_ANALYZE_AFTER_ROWS = 1000
+
+# Share of distinct values above which a VARCHAR column stops dictionary encoding
+_DICTIONARY_MAX_RATIO = 0.3
+
+
 class Table:
-    """Represents a database table with schema and rows."""
+    """
+    Represents a database table with schema and rows.
+    
+    Values are stored column-at-a-time: one list per schema column, all of
+    the same length. Rows are materialized only when a caller asks for them.
+    """
+    
+    __slots__ = ('name', 'schema', '_columns', '_eq_indexes', 'version')
     
     def __init__(self, name: str, schema: Schema):
         """Initialize table with name and schema."""
@@ -18,8 +38,21 @@ class Table:
         
         self.name = name
         self.schema = schema
-        self.rows: List[Row] = []
-        self.row_count = 0
+        self._columns: List[List[Any]] = [[] for _ in schema.columns]
+        # Equality indexes built on demand, keyed by column index: each maps a
+        # value to its ascending row positions and records how many rows it covers
+        self._eq_indexes: Dict[int, Tuple[Dict[Any, List[int]], int]] = {}
+        self.version = next(_VERSIONS)
+    
+    @property
+    def row_count(self) -> int:
+        """Number of rows stored in the table."""
+        return len(self._columns[0])
+    
+    @property
+    def rows(self) -> List[Row]:
+        """All rows in the table, materialized from the column lists."""
+        return list(self.scan())
     
     def insert(self, row: Row) -> None:
         """Insert a row into the table after validation."""
@@ -31,26 +64,175 @@ class Table:
         
         # Validate and convert row values
         validated_values = self.schema.validate_and_convert_row(row.values)
-        validated_row = Row(validated_values)
         
-        self.rows.append(validated_row)
-        self.row_count += 1
+        for column, value in zip(self._columns, validated_values):
+            column.append(value)
+        self.version = next(_VERSIONS)
+        
+        if len(self._columns[0]) == _ANALYZE_AFTER_ROWS:
+            self.analyze()
     
     def insert_values(self, values: List[Any]) -> None:
         """Insert values as a new row."""
         row = Row(values)
         self.insert(row)
     
-    def scan(self) -> Iterator[Row]:
-        """Scan all rows in the table."""
-        for row in self.rows:
-            yield row
+    def insert_many(self, rows: List[List[Any]]) -> None:
+        """
+        Insert several rows of values at once, converting column-at-a-time.
+        
+        Each column's values are converted (which validates them) in one
+        pass, then appended to storage together. The batch is atomic: if any row is
+        invalid, no rows are inserted.
+        
+        Args:
+            rows: The rows to insert, each a list of values in schema order
+            
+        Raises:
+            ValidationError: If a row has the wrong width or an invalid value
+        """
+        if not rows:
+            return
+        
+        # Check every width in one pass, then find the offending row on failure
+        width = len(self.schema.columns)
+        if set(map(len, rows)) != {width}:
+            for values in rows:
+                if len(values) != width:
+                    raise ValidationError(
+                        f"Row has {len(values)} values but table '{self.name}' "
+                        f"expects {width} columns"
+                    )
+        
+        converted_columns = []
+        for column, values in zip(self.schema.columns, zip(*rows)):
+            try:
+                converted_columns.append(column.convert_values(values))
+            except Exception as e:
+                raise ValidationError(f"Row validation failed: {e}")
+        
+        before = len(self._columns[0])
+        for column, converted in zip(self._columns, converted_columns):
+            column.extend(converted)
+        self.version = next(_VERSIONS)
+        
+        if before < _ANALYZE_AFTER_ROWS <= len(self._columns[0]):
+            self.analyze()
+    
+    def _projection_columns(self, projection: Optional[List[str]]) -> List[List[Any]]:
+        """Get the storage lists of the named columns, in order; all columns if None."""
+        if projection is None:
+            return self._columns
+        return [self._columns[self.schema.get_column_index(name)] for name in projection]
+    
+    def analyze(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Profile each column and choose VARCHAR encodings from the data.
+        
+        A VARCHAR column keeps dictionary encoding only while its distinct
+        values are at most _DICTIONARY_MAX_RATIO of its rows; otherwise the
+        dictionary would hold nearly every value and save nothing. Runs on
+        its own when the table first reaches _ANALYZE_AFTER_ROWS rows.
+        
+        Returns:
+            For each column name, its 'distinct' and 'nulls' value counts and
+            whether it is 'dictionary_encoded'
+        """
+        total = len(self._columns[0])
+        stats = {}
+        for column, values in zip(self.schema.columns, self._columns):
+            nulls = values.count(None)
+            distinct = len(set(values)) - (nulls > 0)
+            if column.data_type == 'VARCHAR' and total:
+                column.set_dictionary_encoding(distinct <= total * _DICTIONARY_MAX_RATIO)
+            stats[column.name] = {
+                'distinct': distinct,
+                'nulls': nulls,
+                'dictionary_encoded': column.dictionary_encoded,
+            }
+        return stats
+    
+    def scan(self, projection: Optional[List[str]] = None) -> Iterator[Row]:
+        """
+        Scan all rows in the table.
+        
+        Args:
+            projection: Columns each row holds, in order (case-insensitive);
+                all columns if None. Only these columns are read.
+            
+        Returns:
+            An iterator over the rows, in table order
+        """
+        return map(Row, zip(*self._projection_columns(projection)))
+    
+    def scan_columns(self, column_names: Optional[List[str]] = None) -> Dict[str, List[Any]]:
+        """
+        Get the stored values of whole columns.
+        
+        The returned lists are the table's own storage and must not be mutated.
+        
+        Args:
+            column_names: Columns to return (case-insensitive); all columns if None
+            
+        Returns:
+            A dict mapping each requested column name to its list of values
+        """
+        if column_names is None:
+            return {col.name: values for col, values in zip(self.schema.columns, self._columns)}
+        return {name: self._columns[self.schema.get_column_index(name)] for name in column_names}
+    
+    def equal_positions(self, column_index: int, value: Any) -> List[int]:
+        """
+        Find the rows whose value in a column equals a given value.
+        
+        The column's hash index is built on the first call and caught up with
+        rows appended since, so repeated lookups cost a dict hit instead of a
+        scan. The returned list belongs to the index and must not be mutated.
+        
+        Args:
+            column_index: Schema index of the column to search
+            value: A hashable value to look up
+            
+        Returns:
+            The ascending positions of the matching rows
+        """
+        column = self._columns[column_index]
+        buckets, indexed = self._eq_indexes.get(column_index, (None, 0))
+        if buckets is None:
+            buckets = defaultdict(list)
+        
+        if indexed < len(column):
+            for position, item in enumerate(islice(column, indexed, None), indexed):
+                buckets[item].append(position)
+            self._eq_indexes[column_index] = (buckets, len(column))
+        
+        return buckets.get(value, [])
+    
+    def lookup_rows(self, column_name: str, value: Any,
+                    projection: Optional[List[str]] = None) -> List[Row]:
+        """
+        Get the rows whose value in a column equals a given value.
+        
+        Positions come from the column's equality index (see equal_positions),
+        so only the matching rows are read and built.
+        
+        Args:
+            column_name: Column to search (case-insensitive)
+            value: A hashable value to look up
+            projection: Columns each row holds, as for scan
+            
+        Returns:
+            The matching rows, in table order
+        """
+        positions = self.equal_positions(self.schema.get_column_index(column_name), value)
+        columns = self._projection_columns(projection)
+        return [Row([column[position] for column in columns]) for position in positions]
     
     def get_row(self, index: int) -> Row:
         """Get row by index."""
-        if index < 0 or index >= len(self.rows):
+        if index < 0 or index >= len(self._columns[0]):
             raise IndexError(f"Row index {index} out of range")
-        return self.rows[index]
+        return Row([column[index] for column in self._columns])
     
     def validate_row(self, row: Row) -> bool:
         """Validate if a row is compatible with this table's schema."""
@@ -70,23 +252,66 @@ class Table:
         """Get column indices for projection."""
         return [self.schema.get_column_index(name) for name in column_names]
     
-    def filter_rows(self, predicate) -> Iterator[Row]:
-        """Filter rows based on a predicate function."""
-        for row in self.rows:
-            if predicate(row):
-                yield row
+    def filter_rows(self, predicate, column_name: Optional[str] = None,
+                    projection: Optional[List[str]] = None) -> Iterator[Row]:
+        """
+        Filter rows based on a predicate function.
+        
+        Args:
+            predicate: Called with each Row, or with each value of column_name
+                if given
+            column_name: Column whose values the predicate tests (case-insensitive);
+                only the matching rows are then built
+            projection: Columns each returned row holds, as for scan; the
+                predicate still sees whole rows when column_name is None
+            
+        Returns:
+            An iterator over the matching rows, in table order
+        """
+        if column_name is None:
+            rows = filter(predicate, self.scan())
+            if projection is None:
+                return rows
+            indices = self.project_columns(projection)
+            return (row.project(indices) for row in rows)
+        
+        values = self._columns[self.schema.get_column_index(column_name)]
+        columns = self._projection_columns(projection)
+        positions = compress(range(len(values)), map(predicate, values))
+        return (Row([column[position] for column in columns]) for position in positions)
+    
+    def count(self, predicate=None, column_name: Optional[str] = None) -> int:
+        """
+        Count rows, optionally only those matching a predicate, without building them.
+        
+        Args:
+            predicate: Called as for filter_rows; all rows are counted if None
+            column_name: Column whose values the predicate tests, as for filter_rows
+            
+        Returns:
+            The number of matching rows
+        """
+        if predicate is None:
+            return len(self._columns[0])
+        if column_name is None:
+            return sum(map(bool, map(predicate, self.scan())))
+        
+        values = self._columns[self.schema.get_column_index(column_name)]
+        return sum(map(bool, map(predicate, values)))
     
     def clear(self) -> None:
         """Remove all rows from the table."""
-        self.rows.clear()
-        self.row_count = 0
+        for column in self._columns:
+            column.clear()
+        self._eq_indexes.clear()
+        self.version = next(_VERSIONS)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert table to dictionary representation."""
         return {
             'name': self.name,
             'schema': self.schema.to_dict(),
-            'rows': [row.to_list() for row in self.rows],
+            'rows': [list(values) for values in zip(*self._columns)],
             'row_count': self.row_count
         }
     
@@ -96,14 +321,13 @@ class Table:
         schema = Schema.from_dict(data['schema'])
         table = cls(data['name'], schema)
         
-        for row_data in data['rows']:
-            table.insert_values(row_data)
+        table.insert_many(data['rows'])
         
         return table
     
     def __len__(self) -> int:
         """Return number of rows in table."""
-        return len(self.rows)
+        return len(self._columns[0])
     
     def __repr__(self) -> str:
         """String representation of table."""
@@ -115,4 +339,4 @@ class Table:
             return False
         return (self.name == other.name and 
                 self.schema == other.schema and 
-                self.rows == other.rows)
\ No newline at end of file
+                self._columns == other._columns)
\ No newline at end of file
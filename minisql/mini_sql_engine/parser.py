@@ -6,12 +6,202 @@ into Abstract Syntax Tree (AST) nodes for further processing.
 """
 
 import re
+import sys
+from collections import Counter, OrderedDict
 from typing import List, Optional, Any, Tuple
-from .ast_nodes import ASTNode, CreateTableNode, InsertNode, SelectNode, WhereClause
+from .ast_nodes import ASTNode, CreateTableNode, InsertNode, SelectNode, WhereClause, COUNT_ALL
 from .models.column import Column
 from .exceptions import ParseError
 
 
+# Token pattern, compiled once: identifiers and keywords, punctuation, quoted
+# strings, numbers, operators, then any other non-whitespace character. The
+# branches (except the catch-all) start with disjoint characters, so they are
+# ordered by how often they occur in SQL rather than by precedence. Quoted
+# strings use the unrolled form [^']*(?:''[^']*)* so runs of ordinary
+# characters are consumed in one step instead of one alternation per character
+_TOKEN_RE = re.compile(r"""
+    \b[A-Za-z_][A-Za-z0-9_]*\b|  # Identifiers and keywords
+    [(),;]|                       # Punctuation
+    '[^']*(?:''[^']*)*'|          # Single-quoted strings (handles escaped quotes)
+    "[^"]*(?:""[^"]*)*"|          # Double-quoted strings (handles escaped quotes)
+    -?\b\d+\.?\d*\b|              # Numbers (int or float, including negative)
+    [<>=!]+|                      # Comparison operators
+    \S                            # Any other non-whitespace character
+""", re.VERBOSE)
+
+# Characters that open (and close) a quoted string token
+_QUOTES = frozenset("'\"")
+
+# Escaped (doubled) form of each quote character
+_ESCAPED_QUOTES = {"'": "''", '"': '""'}
+
+# Identifier: letters, digits, underscores and hyphens, with at least one
+# letter or digit
+_IDENTIFIER_RE = re.compile(r'[_-]*[^\W_][\w-]*\Z')
+
+# Keyword literals and the values they stand for
+_KEYWORD_LITERALS = {'NULL': None, 'TRUE': True, 'FALSE': False}
+
+# Data types accepted in column definitions, and their listing for errors
+_VALID_TYPES = frozenset({'INT', 'VARCHAR', 'FLOAT', 'BOOLEAN'})
+_VALID_TYPES_TEXT = ', '.join(sorted(_VALID_TYPES))
+
+# Comparison operators accepted in WHERE clauses, and their listing for errors
+_VALID_OPERATORS = frozenset({'=', '!=', '<>', '>', '<', '>=', '<='})
+_VALID_OPERATORS_TEXT = ', '.join(sorted(_VALID_OPERATORS))
+
+# Parser method and statement name for each supported leading command keyword
+_COMMANDS = {
+    'CREATE': ('_parse_create_table', 'CREATE TABLE'),
+    'INSERT': ('_parse_insert', 'INSERT'),
+    'SELECT': ('_parse_select', 'SELECT'),
+}
+
+
+def _strip_quotes(token: str) -> str:
+    """
+    Remove the outer quotes from a quoted string token and unescape its content.
+    
+    Args:
+        token: A token that starts and ends with the same quote character
+        
+    Returns:
+        The string content with doubled quotes collapsed
+    """
+    quote = token[0]
+    content = token[1:-1]
+    # Most literals contain no escapes and can be returned as sliced
+    if _ESCAPED_QUOTES[quote] not in content:
+        return content
+    return content.replace(_ESCAPED_QUOTES[quote], quote)
+
+
+def _is_identifier(name: str) -> bool:
+    """Return True if name is a valid table or column name."""
+    # Bare names from the tokenizer are ASCII identifiers; those need only
+    # C-level string checks, plus at least one non-underscore character
+    if name.isascii() and name.isidentifier():
+        return name.lstrip('_') != ''
+    return _IDENTIFIER_RE.match(name) is not None
+
+
+def _parse_literal(token: str) -> Any:
+    """Parse a single value token into NULL, a boolean, a number or a string."""
+    # A token starting with a letter is never a number: it is either NULL,
+    # a boolean or a string, so it skips the int/float attempt entirely
+    if token[:1].isalpha():
+        upper = token.upper()
+        if upper in _KEYWORD_LITERALS:
+            return _KEYWORD_LITERALS[upper]
+        return token
+    
+    # Try to parse as number
+    try:
+        if '.' in token:
+            value = float(token)
+            # Check for reasonable float range
+            if abs(value) > 1e308:
+                raise ParseError(f"Float value too large: {token}")
+            return value
+        else:
+            value = int(token)
+            # Check for reasonable integer range
+            if abs(value) > 2**63 - 1:
+                raise ParseError(f"Integer value too large: {token}")
+            return value
+    except ValueError:
+        # If it's not a valid number, treat as string
+        pass
+    except OverflowError:
+        raise ParseError(f"Numeric value out of range: {token}")
+    
+    # Default to string
+    return token
+
+
+def _split_on_commas(tokens: List[str]) -> List[List[str]]:
+    """
+    Split a token list into the groups between ',' tokens.
+    
+    Args:
+        tokens: The tokens of a comma-separated list
+        
+    Returns:
+        One list of tokens per list item; n commas always give n + 1 groups,
+        with empty groups where items are missing
+    """
+    groups = []
+    start = 0
+    while True:
+        try:
+            end = tokens.index(',', start)
+        except ValueError:
+            groups.append(tokens[start:])
+            return groups
+        groups.append(tokens[start:end])
+        start = end + 1
+
+
+def _duplicate_names(names: List[str]) -> List[str]:
+    """Return each name that occurs more than once, in first-seen order."""
+    return [name for name, count in Counter(names).items() if count > 1]
+
+
+def _find_closing_paren(tokens: List[str], open_index: int) -> int:
+    """
+    Find the ')' token matching the '(' at open_index.
+    
+    Most parenthesized lists contain no nested parentheses, so the first ')'
+    is located with list.index and only a nested '(' before it falls back
+    to counting depth token by token.
+    
+    Args:
+        tokens: The statement tokens
+        open_index: Index of the opening '(' token
+        
+    Returns:
+        Index of the matching ')', or -1 if it is missing
+    """
+    try:
+        close_index = tokens.index(')', open_index + 1)
+    except ValueError:
+        return -1
+    try:
+        tokens.index('(', open_index + 1, close_index)
+    except ValueError:
+        return close_index
+    
+    depth = 0
+    for i in range(open_index, len(tokens)):
+        if tokens[i] == '(':
+            depth += 1
+        elif tokens[i] == ')':
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+
+def _leading_token(sql: str) -> Tuple[str, int]:
+    """
+    Read the first token of a non-blank SQL string.
+    
+    The token is unquoted the same way _tokenize treats every token.
+    
+    Args:
+        sql: The SQL command string; must contain a non-whitespace character
+        
+    Returns:
+        The first token and the offset just past it in sql
+    """
+    match = _TOKEN_RE.search(sql)
+    token = match.group(0)
+    if token[0] in _QUOTES and token[-1] == token[0]:
+        token = _strip_quotes(token)
+    return token, match.end()
+
+
 class SQLParser:
     """
     SQL parser that converts SQL command strings into AST nodes.
@@ -29,11 +219,19 @@ class SQLParser:
             'CREATE', 'TABLE', 'INSERT', 'INTO', 'VALUES', 'SELECT', 'FROM', 'WHERE',
             'INT', 'VARCHAR', 'FLOAT', 'BOOLEAN', 'NULL', 'NOT', 'AND', 'OR'
         }
+        # Parsed AST nodes keyed by SQL text, least recently used first
+        self._parse_cache: "OrderedDict[str, ASTNode]" = OrderedDict()
+        self._parse_cache_max = 1024
     
     def parse(self, sql: str) -> ASTNode:
         """
         Parse a SQL command string into an AST node.
         
+        Results are cached by SQL text, so repeated commands return the same
+        AST node; callers must treat the returned node as read-only. CREATE
+        TABLE statements are not cached, so each one gets its own Column
+        objects, which hold per-table state once the table exists.
+        
         Args:
             sql: The SQL command string to parse
             
@@ -43,125 +241,110 @@ class SQLParser:
         Raises:
             ParseError: If the SQL command cannot be parsed
         """
+        node = self._parse_cache.get(sql)
+        if node is not None:
+            self._parse_cache.move_to_end(sql)
+            return node
+        
+        node = self._parse(sql)
+        if isinstance(node, CreateTableNode):
+            return node
+        self._parse_cache[sql] = node
+        if len(self._parse_cache) > self._parse_cache_max:
+            self._parse_cache.popitem(last=False)
+        return node
+    
+    def clear_cache(self) -> None:
+        """Discard all cached parse results."""
+        self._parse_cache.clear()
+    
+    def _parse(self, sql: str) -> ASTNode:
+        """Parse a SQL command string into an AST node, bypassing the cache."""
         if not sql or not sql.strip():
             raise ParseError("Empty SQL command", sql=sql)
         
+        statement = None
         try:
-            # Tokenize the SQL command
-            tokens = self._tokenize(sql)
+            # Determine command type from the first token alone, so unsupported
+            # commands are rejected without tokenizing the whole statement
+            first, end = _leading_token(sql)
+            command = first.upper()
             
-            if not tokens:
-                raise ParseError("No tokens found in SQL command", sql=sql)
+            if command not in _COMMANDS:
+                raise ParseError(f"Unsupported SQL command: {command}. Supported commands are: CREATE TABLE, INSERT INTO, SELECT", sql=sql)
+            handler, statement = _COMMANDS[command]
             
-            # Determine command type and parse accordingly
-            command = tokens[0].upper()
+            # Tokenize the rest of the SQL command; the first word is already read
+            tokens = self._tokenize(sql, end)
             
-            if command == 'CREATE':
-                return self._parse_create_table(tokens)
-            elif command == 'INSERT':
-                return self._parse_insert(tokens)
-            elif command == 'SELECT':
-                return self._parse_select(tokens)
-            else:
-                raise ParseError(f"Unsupported SQL command: {command}. Supported commands are: CREATE TABLE, INSERT INTO, SELECT", sql=sql)
+            # Uppercase keyword candidates once so clause lookups can compare
+            # directly and search with list.index
+            upper_tokens = [token.upper() if token and token[0].isalpha() else token
+                            for token in tokens]
+            tokens.insert(0, first)
+            upper_tokens.insert(0, command)
+            
+            return getattr(self, handler)(tokens, upper_tokens)
                 
         except ParseError:
             # Re-raise ParseError as-is to preserve context
             raise
         except Exception as e:
-            # Wrap unexpected errors in ParseError
+            # Wrap unexpected errors in ParseError, naming the statement being
+            # parsed when the failure came from a statement parser
+            if statement is not None:
+                raise ParseError(f"Error parsing {statement} statement: {e}", sql=sql)
             raise ParseError(f"Unexpected error during parsing: {e}", sql=sql)
     
-    def _tokenize(self, sql: str) -> List[str]:
+    def _tokenize(self, sql: str, pos: int = 0) -> List[str]:
         """
         Tokenize a SQL command string into individual tokens.
         
         Args:
             sql: The SQL command string to tokenize
+            pos: Offset in sql to start from, at a token boundary
             
         Returns:
             List of tokens
         """
-        # Remove extra whitespace and normalize
-        sql = sql.strip()
-        
-        # Pattern to match SQL tokens including quoted strings, numbers, operators, and identifiers
-        token_pattern = r"""
-            '(?:[^']|'')*'|               # Single-quoted strings (handles escaped quotes)
-            "(?:[^"]|"")*"|               # Double-quoted strings (handles escaped quotes)
-            -?\b\d+\.?\d*\b|              # Numbers (int or float, including negative)
-            [<>=!]+|                      # Comparison operators
-            [(),;]|                       # Punctuation
-            \b[A-Za-z_][A-Za-z0-9_]*\b|  # Identifiers and keywords
-            \S                            # Any other non-whitespace character
-        """
-        
-        tokens = []
-        for match in re.finditer(token_pattern, sql, re.VERBOSE):
-            token = match.group(0)
-            
-            # Handle quoted strings - remove quotes and keep the content
-            if (token.startswith("'") and token.endswith("'")) or \
-               (token.startswith('"') and token.endswith('"')):
-                # Remove outer quotes and handle escaped quotes
-                content = token[1:-1]
-                if token.startswith("'"):
-                    content = content.replace("''", "'")  # Unescape single quotes
-                else:
-                    content = content.replace('""', '"')  # Unescape double quotes
-                tokens.append(content)
-            else:
-                tokens.append(token)
-        
-        return tokens
+        # findall returns the matched strings directly, without building a
+        # match object per token; only quoted strings need a second look
+        return [
+            _strip_quotes(token) if token[0] in _QUOTES and token[-1] == token[0] else token
+            for token in _TOKEN_RE.findall(sql, pos)
+        ]
     
-    def _parse_create_table(self, tokens: List[str]) -> CreateTableNode:
+    def _parse_create_table(self, tokens: List[str], upper_tokens: List[str]) -> CreateTableNode:
         """
         Parse CREATE TABLE statement.
         
         Expected format: CREATE TABLE table_name (column_name data_type, ...)
         """
-        try:
-            if len(tokens) < 4:
-                raise ParseError("Invalid CREATE TABLE syntax. Expected: CREATE TABLE table_name (column_definitions)")
-            
-            if tokens[1].upper() != 'TABLE':
-                raise ParseError("Expected 'TABLE' after 'CREATE'")
-            
-            table_name = tokens[2]
-            
-            # Validate table name
-            if not table_name or not table_name.replace('_', '').replace('-', '').isalnum():
-                raise ParseError(f"Invalid table name: '{table_name}'. Table names must contain only letters, numbers, underscores, and hyphens")
-            
-            if len(tokens) < 5 or tokens[3] != '(':
-                raise ParseError("Expected '(' after table name in CREATE TABLE statement")
-            
-            # Find the closing parenthesis
-            paren_end = -1
-            paren_count = 0
-            for i in range(3, len(tokens)):
-                if tokens[i] == '(':
-                    paren_count += 1
-                elif tokens[i] == ')':
-                    paren_count -= 1
-                    if paren_count == 0:
-                        paren_end = i
-                        break
-            
-            if paren_end == -1:
-                raise ParseError("Missing closing ')' in CREATE TABLE statement")
-            
-            # Parse column definitions
-            column_tokens = tokens[4:paren_end]
-            columns = self._parse_column_definitions(column_tokens)
-            
-            return CreateTableNode(table_name, columns)
-            
-        except ParseError:
-            raise
-        except Exception as e:
-            raise ParseError(f"Error parsing CREATE TABLE statement: {e}")
+        if len(tokens) < 4:
+            raise ParseError("Invalid CREATE TABLE syntax. Expected: CREATE TABLE table_name (column_definitions)")
+        
+        if upper_tokens[1] != 'TABLE':
+            raise ParseError("Expected 'TABLE' after 'CREATE'")
+        
+        table_name = tokens[2]
+        
+        # Validate table name
+        if not _is_identifier(table_name):
+            raise ParseError(f"Invalid table name: '{table_name}'. Table names must contain only letters, numbers, underscores, and hyphens")
+        
+        if len(tokens) < 5 or tokens[3] != '(':
+            raise ParseError("Expected '(' after table name in CREATE TABLE statement")
+        
+        # Find the closing parenthesis
+        paren_end = _find_closing_paren(tokens, 3)
+        if paren_end == -1:
+            raise ParseError("Missing closing ')' in CREATE TABLE statement")
+        
+        # Parse column definitions
+        column_tokens = tokens[4:paren_end]
+        columns = self._parse_column_definitions(column_tokens)
+        
+        return CreateTableNode(table_name, columns)
     
     def _parse_column_definitions(self, tokens: List[str]) -> List[Column]:
         """Parse column definitions from CREATE TABLE statement."""
@@ -169,32 +352,26 @@ class SQLParser:
             raise ParseError("No column definitions found in CREATE TABLE statement")
         
         columns = []
-        current_column = []
-        
-        for token in tokens:
-            if token == ',':
-                if current_column:
-                    columns.append(self._parse_single_column(current_column))
-                    current_column = []
-                else:
-                    raise ParseError("Invalid column definition: empty column after comma")
-            else:
-                current_column.append(token)
+        groups = _split_on_commas(tokens)
+        
+        for group in groups[:-1]:
+            if not group:
+                raise ParseError("Invalid column definition: empty column after comma")
+            columns.append(self._parse_single_column(group))
         
-        # Handle the last column (no trailing comma)
-        if current_column:
-            columns.append(self._parse_single_column(current_column))
-        elif tokens and tokens[-1] == ',':
+        # Handle the last column; an empty one means the list ended in a comma
+        if groups[-1]:
+            columns.append(self._parse_single_column(groups[-1]))
+        else:
             raise ParseError("Invalid column definition: trailing comma in column list")
         
         if not columns:
             raise ParseError("No valid column definitions found in CREATE TABLE statement")
         
         # Check for duplicate column names
-        column_names = [col.name.lower() for col in columns]
-        if len(column_names) != len(set(column_names)):
-            duplicates = [name for name in column_names if column_names.count(name) > 1]
-            raise ParseError(f"Duplicate column names found: {', '.join(set(duplicates))}")
+        duplicates = _duplicate_names([col.name.lower() for col in columns])
+        if duplicates:
+            raise ParseError(f"Duplicate column names found: {', '.join(duplicates)}")
         
         return columns
     
@@ -207,13 +384,12 @@ class SQLParser:
         data_type = tokens[1].upper()
         
         # Validate column name
-        if not column_name or not column_name.replace('_', '').replace('-', '').isalnum():
+        if not _is_identifier(column_name):
             raise ParseError(f"Invalid column name: '{column_name}'. Column names must contain only letters, numbers, underscores, and hyphens")
         
         # Validate data type
-        valid_types = {'INT', 'VARCHAR', 'FLOAT', 'BOOLEAN'}
-        if data_type not in valid_types:
-            raise ParseError(f"Invalid data type: '{data_type}'. Supported types are: {', '.join(sorted(valid_types))}")
+        if data_type not in _VALID_TYPES:
+            raise ParseError(f"Invalid data type: '{data_type}'. Supported types are: {_VALID_TYPES_TEXT}")
         
         # Handle VARCHAR with length specification
         max_length = None
@@ -230,81 +406,67 @@ class SQLParser:
             else:
                 raise ParseError(f"Invalid VARCHAR length specification. Expected: VARCHAR ( length )")
         
-        return Column(name=column_name, data_type=data_type, max_length=max_length)
+        # Interned like the names in other AST nodes, so schema lookups hit by identity
+        return Column(name=sys.intern(column_name), data_type=data_type, max_length=max_length)
     
-    def _parse_insert(self, tokens: List[str]) -> InsertNode:
+    def _parse_insert(self, tokens: List[str], upper_tokens: List[str]) -> InsertNode:
         """
         Parse INSERT statement.
         
         Expected format: INSERT INTO table_name VALUES (value1, value2, ...)
         """
-        try:
-            if len(tokens) < 6:
-                raise ParseError("Invalid INSERT syntax. Expected: INSERT INTO table_name VALUES (value1, value2, ...)")
-            
-            if tokens[1].upper() != 'INTO':
-                raise ParseError("Expected 'INTO' after 'INSERT'")
-            
-            table_name = tokens[2]
-            
-            # Validate table name
-            if not table_name or not table_name.replace('_', '').replace('-', '').isalnum():
-                raise ParseError(f"Invalid table name: '{table_name}'. Table names must contain only letters, numbers, underscores, and hyphens")
-            
-            if tokens[3].upper() != 'VALUES':
-                raise ParseError("Expected 'VALUES' after table name in INSERT statement")
-            
-            if tokens[4] != '(':
-                raise ParseError("Expected '(' after 'VALUES'")
-            
-            # Find the closing parenthesis
-            paren_end = -1
-            paren_count = 0
-            for i in range(4, len(tokens)):
-                if tokens[i] == '(':
-                    paren_count += 1
-                elif tokens[i] == ')':
-                    paren_count -= 1
-                    if paren_count == 0:
-                        paren_end = i
-                        break
-            
-            if paren_end == -1:
-                raise ParseError("Missing closing ')' in INSERT VALUES statement")
-            
-            # Parse values
-            value_tokens = tokens[5:paren_end]
-            values = self._parse_values(value_tokens)
-            
-            return InsertNode(table_name, values)
-            
-        except ParseError:
-            raise
-        except Exception as e:
-            raise ParseError(f"Error parsing INSERT statement: {e}")
+        if len(tokens) < 6:
+            raise ParseError("Invalid INSERT syntax. Expected: INSERT INTO table_name VALUES (value1, value2, ...)")
+        
+        if upper_tokens[1] != 'INTO':
+            raise ParseError("Expected 'INTO' after 'INSERT'")
+        
+        table_name = tokens[2]
+        
+        # Validate table name
+        if not _is_identifier(table_name):
+            raise ParseError(f"Invalid table name: '{table_name}'. Table names must contain only letters, numbers, underscores, and hyphens")
+        
+        if upper_tokens[3] != 'VALUES':
+            raise ParseError("Expected 'VALUES' after table name in INSERT statement")
+        
+        if tokens[4] != '(':
+            raise ParseError("Expected '(' after 'VALUES'")
+        
+        # Find the closing parenthesis
+        paren_end = _find_closing_paren(tokens, 4)
+        if paren_end == -1:
+            raise ParseError("Missing closing ')' in INSERT VALUES statement")
+        
+        # Parse values
+        value_tokens = tokens[5:paren_end]
+        values = self._parse_values(value_tokens)
+        
+        return InsertNode(table_name, values)
     
     def _parse_values(self, tokens: List[str]) -> List[Any]:
         """Parse values from INSERT statement."""
         if not tokens:
             raise ParseError("No values found in INSERT statement")
         
+        # Well-formed lists alternate value, ',', value, ...; parse the values
+        # in place without gathering each one into its own token list
+        if (len(tokens) % 2 == 1 and ',' not in tokens[::2]
+                and tokens[1::2].count(',') == len(tokens) // 2):
+            return [_parse_literal(token) for token in tokens[::2]]
+        
         values = []
-        current_value_tokens = []
-        
-        for token in tokens:
-            if token == ',':
-                if current_value_tokens:
-                    values.append(self._parse_single_value(current_value_tokens))
-                    current_value_tokens = []
-                else:
-                    raise ParseError("Invalid value list: empty value after comma")
-            else:
-                current_value_tokens.append(token)
+        groups = _split_on_commas(tokens)
+        
+        for group in groups[:-1]:
+            if not group:
+                raise ParseError("Invalid value list: empty value after comma")
+            values.append(self._parse_single_value(group))
         
-        # Handle the last value (no trailing comma)
-        if current_value_tokens:
-            values.append(self._parse_single_value(current_value_tokens))
-        elif tokens and tokens[-1] == ',':
+        # Handle the last value; an empty one means the list ended in a comma
+        if groups[-1]:
+            values.append(self._parse_single_value(groups[-1]))
+        else:
             raise ParseError("Invalid value list: trailing comma")
         
         if not values:
@@ -317,96 +479,55 @@ class SQLParser:
         if len(tokens) != 1:
             raise ParseError(f"Invalid value: '{' '.join(tokens)}'. Each value must be a single token")
         
-        token = tokens[0]
-        
-        # Handle NULL
-        if token.upper() == 'NULL':
-            return None
+        return _parse_literal(tokens[0])
+    
+    def _parse_select(self, tokens: List[str], upper_tokens: List[str]) -> SelectNode:
+        """
+        Parse SELECT statement.
         
-        # Handle boolean values
-        if token.upper() in ('TRUE', 'FALSE'):
-            return token.upper() == 'TRUE'
+        Expected format: SELECT column1, column2 FROM table_name [WHERE condition],
+        where the column list may also be * or COUNT(*)
+        """
+        if len(tokens) < 4:
+            raise ParseError("Invalid SELECT syntax. Expected: SELECT columns FROM table_name [WHERE condition]")
         
-        # Try to parse as number
+        # Find FROM keyword
         try:
-            if '.' in token:
-                value = float(token)
-                # Check for reasonable float range
-                if abs(value) > 1e308:
-                    raise ParseError(f"Float value too large: {token}")
-                return value
-            else:
-                value = int(token)
-                # Check for reasonable integer range
-                if abs(value) > 2**63 - 1:
-                    raise ParseError(f"Integer value too large: {token}")
-                return value
+            from_index = upper_tokens.index('FROM')
         except ValueError:
-            # If it's not a valid number, treat as string
-            pass
-        except OverflowError:
-            raise ParseError(f"Numeric value out of range: {token}")
+            raise ParseError("Missing 'FROM' clause in SELECT statement")
         
-        # Default to string
-        return token
-    
-    def _parse_select(self, tokens: List[str]) -> SelectNode:
-        """
-        Parse SELECT statement.
+        if from_index == 1:
+            raise ParseError("Missing column list in SELECT statement")
         
-        Expected format: SELECT column1, column2 FROM table_name [WHERE condition]
-        """
+        # Parse column list
+        column_tokens = tokens[1:from_index]
+        columns = self._parse_select_columns(column_tokens)
+        
+        # Get table name
+        if from_index + 1 >= len(tokens):
+            raise ParseError("Missing table name after 'FROM'")
+        
+        table_name = tokens[from_index + 1]
+        
+        # Validate table name
+        if not _is_identifier(table_name):
+            raise ParseError(f"Invalid table name: '{table_name}'. Table names must contain only letters, numbers, underscores, and hyphens")
+        
+        # Parse optional WHERE clause
+        where_clause = None
         try:
-            if len(tokens) < 4:
-                raise ParseError("Invalid SELECT syntax. Expected: SELECT columns FROM table_name [WHERE condition]")
-            
-            # Find FROM keyword
-            from_index = -1
-            for i, token in enumerate(tokens):
-                if token.upper() == 'FROM':
-                    from_index = i
-                    break
-            
-            if from_index == -1:
-                raise ParseError("Missing 'FROM' clause in SELECT statement")
-            
-            if from_index == 1:
-                raise ParseError("Missing column list in SELECT statement")
-            
-            # Parse column list
-            column_tokens = tokens[1:from_index]
-            columns = self._parse_select_columns(column_tokens)
-            
-            # Get table name
-            if from_index + 1 >= len(tokens):
-                raise ParseError("Missing table name after 'FROM'")
-            
-            table_name = tokens[from_index + 1]
-            
-            # Validate table name
-            if not table_name or not table_name.replace('_', '').replace('-', '').isalnum():
-                raise ParseError(f"Invalid table name: '{table_name}'. Table names must contain only letters, numbers, underscores, and hyphens")
-            
-            # Parse optional WHERE clause
-            where_clause = None
+            where_index = upper_tokens.index('WHERE', from_index + 2)
+        except ValueError:
             where_index = -1
-            for i in range(from_index + 2, len(tokens)):
-                if tokens[i].upper() == 'WHERE':
-                    where_index = i
-                    break
-            
-            if where_index != -1:
-                if where_index + 1 >= len(tokens):
-                    raise ParseError("Missing condition after 'WHERE'")
-                where_tokens = tokens[where_index + 1:]
-                where_clause = self._parse_where_clause(where_tokens)
-            
-            return SelectNode(table_name, columns, where_clause)
-            
-        except ParseError:
-            raise
-        except Exception as e:
-            raise ParseError(f"Error parsing SELECT statement: {e}")
+        
+        if where_index != -1:
+            if where_index + 1 >= len(tokens):
+                raise ParseError("Missing condition after 'WHERE'")
+            where_tokens = tokens[where_index + 1:]
+            where_clause = self._parse_where_clause(where_tokens)
+        
+        return SelectNode(table_name, columns, where_clause)
     
     def _parse_select_columns(self, tokens: List[str]) -> List[str]:
         """Parse column list from SELECT statement."""
@@ -417,41 +538,39 @@ class SQLParser:
         if len(tokens) == 1 and tokens[0] == '*':
             return ['*']
         
+        # Handle SELECT COUNT(*)
+        if len(tokens) == 4 and tokens[0].upper() == 'COUNT' and tokens[1:] == ['(', '*', ')']:
+            return [COUNT_ALL]
+        
         columns = []
-        current_column = []
-        
-        for token in tokens:
-            if token == ',':
-                if current_column:
-                    column_name = ''.join(current_column)
-                    if not column_name.strip():
-                        raise ParseError("Invalid column list: empty column name")
-                    columns.append(column_name)
-                    current_column = []
-                else:
-                    raise ParseError("Invalid column list: empty column after comma")
-            else:
-                current_column.append(token)
+        groups = _split_on_commas(tokens)
+        
+        for group in groups[:-1]:
+            if not group:
+                raise ParseError("Invalid column list: empty column after comma")
+            column_name = ''.join(group)
+            if not column_name.strip():
+                raise ParseError("Invalid column list: empty column name")
+            columns.append(column_name)
         
-        # Handle the last column (no trailing comma)
-        if current_column:
-            column_name = ''.join(current_column)
+        # Handle the last column; an empty one means the list ended in a comma
+        if groups[-1]:
+            column_name = ''.join(groups[-1])
             if not column_name.strip():
                 raise ParseError("Invalid column list: empty column name")
             columns.append(column_name)
-        elif tokens and tokens[-1] == ',':
+        else:
             raise ParseError("Invalid column list: trailing comma")
         
         # Validate column names
         for col in columns:
-            if not col.replace('_', '').replace('-', '').isalnum():
+            if not _is_identifier(col):
                 raise ParseError(f"Invalid column name: '{col}'. Column names must contain only letters, numbers, underscores, and hyphens")
         
         # Check for duplicate columns
-        column_names_lower = [col.lower() for col in columns]
-        if len(column_names_lower) != len(set(column_names_lower)):
-            duplicates = [name for name in column_names_lower if column_names_lower.count(name) > 1]
-            raise ParseError(f"Duplicate column names in SELECT: {', '.join(set(duplicates))}")
+        duplicates = _duplicate_names([col.lower() for col in columns])
+        if duplicates:
+            raise ParseError(f"Duplicate column names in SELECT: {', '.join(duplicates)}")
         
         return columns
     
@@ -466,17 +585,16 @@ class SQLParser:
         value_token = tokens[2]
         
         # Validate column name
-        if not column.replace('_', '').replace('-', '').isalnum():
+        if not _is_identifier(column):
             raise ParseError(f"Invalid column name in WHERE clause: '{column}'. Column names must contain only letters, numbers, underscores, and hyphens")
         
         # Validate operator
-        valid_operators = {'=', '!=', '<>', '>', '<', '>=', '<='}
-        if operator not in valid_operators:
-            raise ParseError(f"Invalid operator in WHERE clause: '{operator}'. Supported operators are: {', '.join(sorted(valid_operators))}")
+        if operator not in _VALID_OPERATORS:
+            raise ParseError(f"Invalid operator in WHERE clause: '{operator}'. Supported operators are: {_VALID_OPERATORS_TEXT}")
         
         # Parse the value
         try:
-            value = self._parse_single_value([value_token])
+            value = _parse_literal(value_token)
         except ParseError as e:
             raise ParseError(f"Invalid value in WHERE clause: {e}")
         
@@ -5,17 +5,50 @@ This module provides the QueryProcessor class that converts AST nodes into
 executable query plans using the visitor pattern.
 """
 
-from typing import List, Any
-from .ast_nodes import ASTNode, CreateTableNode, InsertNode, SelectNode
+from itertools import compress
+from operator import attrgetter, itemgetter
+from typing import List, Any, ClassVar, Iterator, Optional
+from .ast_nodes import ASTNode, CreateTableNode, InsertNode, SelectNode, COUNT_ALL
 from .models.schema import Schema
 from .models.row import Row
 from .storage_manager import StorageManager
-from .exceptions import ProcessingError, ValidationError
+from .exceptions import ProcessingError, ValidationError, TableNotFoundError, ColumnNotFoundError
+
+
+# Rows per RecordBatch produced by a batched scan
+BATCH_SIZE = 4096
+
+# Reads the value list of a Row
+_ROW_VALUES = attrgetter('values')
+
+
+class RecordBatch:
+    """A run of consecutive table rows held column-at-a-time."""
+    
+    __slots__ = ('columns', 'num_rows', 'offset')
+    
+    def __init__(self, columns: List[List[Any]], num_rows: int, offset: int = 0):
+        """
+        Initialize a record batch.
+        
+        Args:
+            columns: One list of values per requested column, all num_rows long
+            num_rows: Number of rows in the batch
+            offset: Table row index of the batch's first row
+        """
+        self.columns = columns
+        self.num_rows = num_rows
+        self.offset = offset
+    
+    def __repr__(self) -> str:
+        return f"RecordBatch(columns={len(self.columns)}, rows={self.num_rows}, offset={self.offset})"
 
 
 class ExecutionPlan:
     """Represents a sequence of operations to execute for a query."""
     
+    __slots__ = ('operations',)
+    
     def __init__(self):
         """Initialize an empty execution plan."""
         self.operations: List['Operation'] = []
@@ -35,6 +68,11 @@ class ExecutionPlan:
 class Operation:
     """Base class for database operations."""
     
+    __slots__ = ()
+    
+    # True for operations whose execute() returns rows rather than a message
+    returns_rows: ClassVar[bool] = False
+    
     def execute(self, storage: StorageManager) -> Any:
         """Execute this operation against the storage manager."""
         raise NotImplementedError("Subclasses must implement execute method")
@@ -43,14 +81,21 @@ class Operation:
 class CreateTableOperation(Operation):
     """Operation to create a new table."""
     
+    __slots__ = ('table_name', 'schema')
+    
     def __init__(self, table_name: str, schema: Schema):
         """Initialize CREATE TABLE operation."""
         self.table_name = table_name
         self.schema = schema
     
     def execute(self, storage: StorageManager) -> str:
-        """Execute the CREATE TABLE operation."""
-        storage.create_table(self.table_name, self.schema)
+        """
+        Execute the CREATE TABLE operation.
+        
+        The table gets its own copy of the schema, since columns keep
+        per-table state; a plan executed again after a DROP starts clean.
+        """
+        storage.create_table(self.table_name, Schema.from_dict(self.schema.to_dict()))
         return f"Table '{self.table_name}' created successfully."
     
     def __repr__(self) -> str:
@@ -60,6 +105,8 @@ class CreateTableOperation(Operation):
 class InsertOperation(Operation):
     """Operation to insert a row into a table."""
     
+    __slots__ = ('table_name', 'values')
+    
     def __init__(self, table_name: str, values: List[Any]):
         """Initialize INSERT operation."""
         self.table_name = table_name
@@ -79,14 +126,46 @@ class InsertOperation(Operation):
 class ScanOperation(Operation):
     """Operation to scan all rows from a table."""
     
+    __slots__ = ('table_name',)
+    
+    returns_rows = True
+    
     def __init__(self, table_name: str):
         """Initialize SCAN operation."""
         self.table_name = table_name
     
-    def execute(self, storage: StorageManager) -> List[Row]:
-        """Execute the SCAN operation."""
-        rows = list(storage.scan_table(self.table_name))
-        return rows
+    def execute(self, storage: StorageManager) -> Iterator[Row]:
+        """
+        Execute the SCAN operation.
+        
+        Rows are built lazily as the result is iterated, so the table is never
+        held twice; callers that need a list materialize it themselves.
+        """
+        return storage.scan_table(self.table_name)
+    
+    def execute_batched(self, storage: StorageManager, column_indices: Optional[List[int]] = None,
+                        batch_size: int = BATCH_SIZE) -> Iterator[RecordBatch]:
+        """
+        Scan the table as a sequence of column batches instead of rows.
+        
+        Args:
+            storage: The storage manager holding the table
+            column_indices: Schema indices of the columns to include, in order;
+                all columns if None
+            batch_size: Maximum number of rows per batch
+            
+        Returns:
+            An iterator of RecordBatch objects covering the table in order
+        """
+        table = storage.get_table(self.table_name)
+        columns = list(table.scan_columns().values())
+        if column_indices is not None:
+            columns = [columns[i] for i in column_indices]
+        
+        total = len(table)
+        for start in range(0, total, batch_size):
+            stop = min(start + batch_size, total)
+            yield RecordBatch([column[start:stop] for column in columns], stop - start, start)
     
     def __repr__(self) -> str:
         return f"ScanOperation(table_name='{self.table_name}')"
@@ -95,46 +174,79 @@ class ScanOperation(Operation):
 class ProjectOperation(Operation):
     """Operation to project specific columns from rows."""
     
+    __slots__ = ('columns', '_resolved')
+    
+    returns_rows = True
+    
     def __init__(self, columns: List[str]):
         """Initialize PROJECT operation."""
         self.columns = columns
+        self._resolved = None  # (schema, indices) from the last column_indices() call
+    
+    def column_indices(self, schema: Schema, table_name: str = None) -> List[int]:
+        """
+        Resolve the projected column names to column indices in a schema.
+        
+        SELECT * resolves to every column in order. The result is cached per
+        schema, so a plan reused across executions resolves its columns once.
+        
+        Args:
+            schema: The schema of the table being projected
+            table_name: Table name used in error messages
+            
+        Returns:
+            The column index for each projected column
+            
+        Raises:
+            ColumnNotFoundError: If a projected column is not in the schema
+        """
+        resolved = self._resolved
+        if resolved is not None and resolved[0] is schema:
+            return resolved[1]
+        
+        if len(self.columns) == 1 and self.columns[0] == '*':
+            indices = list(range(len(schema.columns)))
+        else:
+            indices = []
+            for col_name in self.columns:
+                try:
+                    indices.append(schema.get_column_index(col_name))
+                except (ValueError, ValidationError):
+                    raise ColumnNotFoundError(f"Column '{col_name}' not found in table '{table_name}'")
+        
+        self._resolved = (schema, indices)
+        return indices
     
     def execute(self, storage: StorageManager, input_rows: List[Row] = None, table_name: str = None) -> List[Row]:
         """Execute the PROJECT operation."""
         if input_rows is None:
             raise ValueError("ProjectOperation requires input rows")
         
-        if not input_rows:
-            return []
-        
         # Get table schema to determine column indices
         if table_name is None:
+            if not input_rows:
+                return []
             raise ValueError("ProjectOperation requires table_name to determine schema")
         
         table = storage.get_table(table_name)
         schema = table.schema
         
+        # Resolve columns before the empty check so unknown columns always fail
+        column_indices = self.column_indices(schema, table_name)
+        
+        if not input_rows:
+            return []
+        
         # Handle SELECT *
         if len(self.columns) == 1 and self.columns[0] == '*':
             return input_rows
         
-        # Find column indices
-        column_indices = []
-        for col_name in self.columns:
-            try:
-                col_index = schema.get_column_index(col_name)
-                column_indices.append(col_index)
-            except (ValueError, ValidationError) as e:
-                from .exceptions import ColumnNotFoundError
-                raise ColumnNotFoundError(f"Column '{col_name}' not found in table '{table_name}'")
-        
-        # Project columns from each row
-        projected_rows = []
-        for row in input_rows:
-            projected_values = [row.values[i] for i in column_indices]
-            projected_rows.append(Row(projected_values))
-        
-        return projected_rows
+        # Project columns from each row, gathering values with a C-level getter
+        values = map(_ROW_VALUES, input_rows)
+        if len(column_indices) == 1:
+            # itemgetter with one index returns the bare value, not a tuple
+            return [Row([value]) for value in map(itemgetter(column_indices[0]), values)]
+        return list(map(Row, map(itemgetter(*column_indices), values)))
     
     def __repr__(self) -> str:
         return f"ProjectOperation(columns={self.columns})"
@@ -143,9 +255,43 @@ class ProjectOperation(Operation):
 class FilterOperation(Operation):
     """Operation to filter rows based on WHERE clause conditions."""
     
+    __slots__ = ('where_clause', '_resolved')
+    
+    returns_rows = True
+    
     def __init__(self, where_clause):
         """Initialize FILTER operation."""
         self.where_clause = where_clause
+        self._resolved = None  # (schema, index) from the last column_index() call
+    
+    def column_index(self, schema: Schema, table_name: str = None) -> int:
+        """
+        Resolve the WHERE clause column to its index in a schema.
+        
+        The result is cached per schema, so a plan reused across executions
+        resolves its column once.
+        
+        Args:
+            schema: The schema of the table being filtered
+            table_name: Table name used in error messages
+            
+        Returns:
+            The index of the WHERE clause column
+            
+        Raises:
+            ColumnNotFoundError: If the WHERE clause column is not in the schema
+        """
+        resolved = self._resolved
+        if resolved is not None and resolved[0] is schema:
+            return resolved[1]
+        
+        try:
+            index = schema.get_column_index(self.where_clause.column)
+        except (ValueError, ValidationError):
+            raise ColumnNotFoundError(f"Column '{self.where_clause.column}' not found in table '{table_name}'")
+        
+        self._resolved = (schema, index)
+        return index
     
     def execute(self, storage: StorageManager, input_rows: List[Row] = None, table_name: str = None) -> List[Row]:
         """Execute the FILTER operation."""
@@ -160,28 +306,35 @@ class FilterOperation(Operation):
             raise ValueError("FilterOperation requires table_name to determine schema")
         
         table = storage.get_table(table_name)
-        schema = table.schema
-        
-        # Find column index for the WHERE clause column
-        try:
-            column_index = schema.get_column_index(self.where_clause.column)
-        except (ValueError, ValidationError) as e:
-            from .exceptions import ColumnNotFoundError
-            raise ColumnNotFoundError(f"Column '{self.where_clause.column}' not found in table '{table_name}'")
+        column_index = self.column_index(table.schema, table_name)
         
-        # Filter rows based on WHERE clause condition
-        filtered_rows = []
-        for row in input_rows:
-            row_value = row.values[column_index]
-            if self.where_clause.evaluate(row_value):
-                filtered_rows.append(row)
+        # Materialize the WHERE column once, in C, and select rows by boolean mask
+        column = list(map(itemgetter(column_index), map(_ROW_VALUES, input_rows)))
+        mask = self.where_clause.evaluate_mask(column)
         
-        return filtered_rows
+        return list(compress(input_rows, mask))
     
     def __repr__(self) -> str:
         return f"FilterOperation(where_clause={self.where_clause})"
 
 
+class CountOperation(Operation):
+    """Operation to count rows, for SELECT COUNT(*)."""
+    
+    __slots__ = ()
+    
+    returns_rows = True
+    
+    def execute(self, storage: StorageManager, input_rows: List[Row] = None, table_name: str = None) -> List[Row]:
+        """Execute the COUNT operation, returning a single row holding the count."""
+        if input_rows is None:
+            raise ValueError("CountOperation requires input rows")
+        return [Row([len(input_rows)])]
+    
+    def __repr__(self) -> str:
+        return "CountOperation()"
+
+
 class QueryProcessor:
     """
     Query processor that converts AST nodes into executable query plans.
@@ -228,26 +381,23 @@ class QueryProcessor:
         Returns:
             ExecutionPlan with CreateTableOperation
         """
+        if not node.table_name:
+            raise ProcessingError("Table name cannot be empty", ast_node_type="CreateTableNode")
+        
+        if not node.columns:
+            raise ProcessingError("Table must have at least one column", ast_node_type="CreateTableNode")
+        
+        # Convert Column objects to Schema
         try:
-            if not node.table_name:
-                raise ProcessingError("Table name cannot be empty", ast_node_type="CreateTableNode")
-            
-            if not node.columns:
-                raise ProcessingError("Table must have at least one column", ast_node_type="CreateTableNode")
-            
-            # Convert Column objects to Schema
             schema = Schema(node.columns)
-            
-            # Create execution plan
-            plan = ExecutionPlan()
-            plan.add_operation(CreateTableOperation(node.table_name, schema))
-            
-            return plan
-            
-        except ProcessingError:
-            raise
-        except Exception as e:
+        except ValueError as e:
             raise ProcessingError(f"Failed to process CREATE TABLE for '{node.table_name}': {e}", ast_node_type="CreateTableNode")
+        
+        # Create execution plan
+        plan = ExecutionPlan()
+        plan.add_operation(CreateTableOperation(node.table_name, schema))
+        
+        return plan
     
     def visit_insert(self, node: InsertNode) -> ExecutionPlan:
         """
@@ -259,23 +409,17 @@ class QueryProcessor:
         Returns:
             ExecutionPlan with InsertOperation
         """
-        try:
-            if not node.table_name:
-                raise ProcessingError("Table name cannot be empty", ast_node_type="InsertNode")
-            
-            if not node.values:
-                raise ProcessingError("INSERT must have at least one value", ast_node_type="InsertNode")
-            
-            # Create execution plan
-            plan = ExecutionPlan()
-            plan.add_operation(InsertOperation(node.table_name, node.values))
-            
-            return plan
-            
-        except ProcessingError:
-            raise
-        except Exception as e:
-            raise ProcessingError(f"Failed to process INSERT for table '{node.table_name}': {e}", ast_node_type="InsertNode")
+        if not node.table_name:
+            raise ProcessingError("Table name cannot be empty", ast_node_type="InsertNode")
+        
+        if not node.values:
+            raise ProcessingError("INSERT must have at least one value", ast_node_type="InsertNode")
+        
+        # Create execution plan
+        plan = ExecutionPlan()
+        plan.add_operation(InsertOperation(node.table_name, node.values))
+        
+        return plan
     
     def visit_select(self, node: SelectNode) -> ExecutionPlan:
         """
@@ -287,29 +431,26 @@ class QueryProcessor:
         Returns:
             ExecutionPlan with SELECT operations
         """
-        try:
-            if not node.table_name:
-                raise ProcessingError("Table name cannot be empty", ast_node_type="SelectNode")
-            
-            if not node.columns:
-                raise ProcessingError("SELECT must specify at least one column", ast_node_type="SelectNode")
-            
-            # Create execution plan
-            plan = ExecutionPlan()
-            
-            # Add scan operation to read from table
-            plan.add_operation(ScanOperation(node.table_name))
-            
-            # Add filter operation if WHERE clause is present
-            if node.where_clause:
-                plan.add_operation(FilterOperation(node.where_clause))
-            
-            # Add project operation to select specific columns
+        if not node.table_name:
+            raise ProcessingError("Table name cannot be empty", ast_node_type="SelectNode")
+        
+        if not node.columns:
+            raise ProcessingError("SELECT must specify at least one column", ast_node_type="SelectNode")
+        
+        # Create execution plan
+        plan = ExecutionPlan()
+        
+        # Add scan operation to read from table
+        plan.add_operation(ScanOperation(node.table_name))
+        
+        # Add filter operation if WHERE clause is present
+        if node.where_clause:
+            plan.add_operation(FilterOperation(node.where_clause))
+        
+        # Add count operation for COUNT(*), else project the selected columns
+        if node.columns == [COUNT_ALL]:
+            plan.add_operation(CountOperation())
+        else:
             plan.add_operation(ProjectOperation(node.columns))
-            
-            return plan
-            
-        except ProcessingError:
-            raise
-        except Exception as e:
-            raise ProcessingError(f"Failed to process SELECT for table '{node.table_name}': {e}", ast_node_type="SelectNode")
\ No newline at end of file
+        
+        return plan
@@ -5,8 +5,11 @@ This module provides the SQLEngine class that coordinates all components
 to process SQL commands from parsing to execution.
 """
 
+from collections import OrderedDict
+
 from .parser import SQLParser
-from .query_processor import QueryProcessor
+from .ast_nodes import CreateTableNode
+from .query_processor import QueryProcessor, ExecutionPlan
 from .execution_engine import ExecutionEngine, QueryResult
 from .storage_manager import StorageManager
 from .exceptions import SQLEngineError
@@ -28,6 +31,11 @@ class SQLEngine:
         self.query_processor = QueryProcessor()
         self.storage_manager = StorageManager(data_directory)
         self.execution_engine = ExecutionEngine(self.storage_manager)
+        # LRU cache of prepared plans keyed by SQL text; plans resolve tables
+        # and columns at execution time, so they stay valid across DDL.
+        # CREATE TABLE plans are not cached: each carries the new table's schema
+        self._plan_cache: "OrderedDict[str, ExecutionPlan]" = OrderedDict()
+        self._plan_cache_max = 256
     
     def execute_sql(self, sql: str) -> QueryResult:
         """
@@ -42,6 +50,31 @@ class SQLEngine:
         Raises:
             SQLEngineError: If any step of execution fails
         """
+        return self.execute_plan(self.prepare(sql))
+    
+    def prepare(self, sql: str) -> ExecutionPlan:
+        """
+        Parse and plan a SQL command without executing it.
+        
+        The returned plan can be passed to execute_plan any number of times.
+        Plans are cached by SQL text, so preparing a statement that was seen
+        recently skips both parsing and planning. CREATE TABLE statements are
+        always prepared afresh.
+        
+        Args:
+            sql: The SQL command string to prepare
+            
+        Returns:
+            ExecutionPlan for the command
+            
+        Raises:
+            SQLEngineError: If parsing or planning fails
+        """
+        plan = self._plan_cache.get(sql)
+        if plan is not None:
+            self._plan_cache.move_to_end(sql)
+            return plan
+        
         try:
             # Parse SQL into AST
             ast = self.parser.parse(sql)
@@ -49,11 +82,42 @@ class SQLEngine:
             # Process AST into execution plan
             plan = self.query_processor.process(ast)
             
-            # Execute the plan
-            result = self.execution_engine.execute(plan)
+        except SQLEngineError:
+            # Re-raise SQL engine errors as-is
+            raise
+        except Exception as e:
+            # Wrap other exceptions
+            raise SQLEngineError(f"Unexpected error executing SQL: {e}")
+        
+        if isinstance(ast, CreateTableNode):
+            return plan
+        
+        self._plan_cache[sql] = plan
+        if len(self._plan_cache) > self._plan_cache_max:
+            self._plan_cache.popitem(last=False)
+        return plan
+    
+    def clear_cache(self) -> None:
+        """Discard all cached plans, parse results and SELECT results."""
+        self._plan_cache.clear()
+        self.parser.clear_cache()
+        self.execution_engine.clear_cache()
+    
+    def execute_plan(self, plan: ExecutionPlan) -> QueryResult:
+        """
+        Execute a previously prepared execution plan.
+        
+        Args:
+            plan: The ExecutionPlan returned by prepare
             
-            return result
+        Returns:
+            QueryResult containing the execution results
             
+        Raises:
+            SQLEngineError: If execution fails
+        """
+        try:
+            return self.execution_engine.execute(plan)
         except SQLEngineError:
             # Re-raise SQL engine errors as-is
             raise
@@ -16,6 +16,10 @@ from .models.column import Column
 from .exceptions import TableNotFoundError, StorageError, ValidationError
 
 
+# Separators for table JSON files; without indent, encoding runs in C
+_JSON_SEPARATORS = (',', ':')
+
+
 class StorageManager:
     """Manages in-memory table storage and file persistence."""
     
@@ -61,23 +65,27 @@ class StorageManager:
         del self.tables[table_name_lower]
     
     def get_table(self, name: str) -> Table:
-        """Get a table by name."""
+        """Get a table by name (case-insensitive)."""
+        # Tables are keyed by lowercased name, so a lowercase name needs no lower() call
+        table = self.tables.get(name)
+        if table is not None:
+            return table
+        
         if not name or not name.strip():
             raise ValidationError("Table name cannot be empty")
         
-        table_name_lower = name.lower()
-        if table_name_lower not in self.tables:
-            available_tables = list(self.tables.keys())
-            if available_tables:
-                raise TableNotFoundError(f"Table '{name}' does not exist. Available tables: {', '.join(available_tables)}", table_name=name)
-            else:
-                raise TableNotFoundError(f"Table '{name}' does not exist. No tables have been created yet", table_name=name)
+        table = self.tables.get(name.lower())
+        if table is None:
+            # The table listing is only built for the error message
+            if self.tables:
+                raise TableNotFoundError(f"Table '{name}' does not exist. Available tables: {', '.join(self.tables)}", table_name=name)
+            raise TableNotFoundError(f"Table '{name}' does not exist. No tables have been created yet", table_name=name)
         
-        return self.tables[table_name_lower]
+        return table
     
     def table_exists(self, name: str) -> bool:
         """Check if a table exists."""
-        return name.lower() in self.tables
+        return name in self.tables or name.lower() in self.tables
     
     def list_tables(self) -> List[str]:
         """Get list of all table names."""
@@ -93,19 +101,29 @@ class StorageManager:
         if not values:
             raise ValidationError("Cannot insert empty values", table_name=table_name)
         
-        try:
-            table = self.get_table(table_name)
-            table.insert_values(values)
-        except (ValidationError, TableNotFoundError):
-            # Re-raise these as-is to preserve context
-            raise
-        except Exception as e:
-            raise StorageError(f"Failed to insert values into table '{table_name}': {e}", operation="insert_values")
+        # Lookup and validation raise TableNotFoundError/ValidationError themselves
+        self.get_table(table_name).insert_values(values)
+    
+    def insert_many(self, table_name: str, rows: List[List[Any]]) -> None:
+        """Insert several rows of values into the specified table as one atomic batch."""
+        self.get_table(table_name).insert_many(rows)
+    
+    def scan_table(self, table_name: str, projection: Optional[List[str]] = None) -> Iterator[Row]:
+        """Scan all rows in the specified table, reading only the projected columns if given."""
+        table = self.get_table(table_name)
+        return table.scan(projection)
+    
+    def filter_rows(self, table_name: str, predicate, column_name: Optional[str] = None,
+                    projection: Optional[List[str]] = None) -> Iterator[Row]:
+        """Lazily yield the rows of a table matching a predicate; see Table.filter_rows."""
+        table = self.get_table(table_name)
+        return table.filter_rows(predicate, column_name, projection)
     
-    def scan_table(self, table_name: str) -> Iterator[Row]:
-        """Scan all rows in the specified table."""
+    def lookup_rows(self, table_name: str, column_name: str, value: Any,
+                    projection: Optional[List[str]] = None) -> List[Row]:
+        """Get the rows of a table whose column equals a value, via the column's index."""
         table = self.get_table(table_name)
-        return table.scan()
+        return table.lookup_rows(column_name, value, projection)
     
     def get_table_schema(self, table_name: str) -> Schema:
         """Get the schema of a table."""
@@ -149,9 +167,8 @@ class StorageManager:
                 # Write header
                 writer.writerow(table.get_column_names())
                 
-                # Write data rows
-                for row in table.scan():
-                    writer.writerow(row.to_list())
+                # Write data rows straight from the column lists
+                writer.writerows(zip(*table.scan_columns().values()))
             
             # Save schema separately
             schema_data = table.schema.to_dict()
@@ -192,10 +209,8 @@ class StorageManager:
                 # Skip header
                 next(reader, None)
                 
-                # Load rows
-                for row_data in reader:
-                    if row_data:  # Skip empty rows
-                        self.insert_values(table_name, row_data)
+                # Load rows in one batch, skipping empty lines
+                self.get_table(table_name).insert_many(list(filter(None, reader)))
                         
         except IOError as e:
             raise StorageError(f"Failed to load table from CSV '{filename}': {e}")
@@ -215,9 +230,11 @@ class StorageManager:
         json_path = self.data_directory / filename
         
         try:
-            table_data = table.to_dict()
+            # Encode in one call and write once; json.dump with indent
+            # encodes in pure Python and writes piece by piece
+            table_data = json.dumps(table.to_dict(), separators=_JSON_SEPARATORS)
             with open(json_path, 'w', encoding='utf-8') as json_file:
-                json.dump(table_data, json_file, indent=2)
+                json_file.write(table_data)
                 
         except IOError as e:
             raise StorageError(f"Failed to save table '{table_name}' to JSON: {e}")
@@ -281,8 +298,11 @@ class StorageManager:
         extension = '.json' if format_type == 'json' else '.csv'
         
         for file_path in self.data_directory.glob(f"*{extension}"):
-            if format_type == 'csv' and file_path.name.endswith('_schema.json'):
-                continue  # Skip schema files
+            if file_path.name.endswith('_schema.json'):
+                if format_type == 'csv':
+                    continue  # Skip schema files
+                if file_path.with_name(f"{file_path.name[:-len('_schema.json')]}.csv").exists():
+                    continue  # A CSV table's schema file, not a JSON table; don't parse it
             
             try:
                 if format_type == 'json':
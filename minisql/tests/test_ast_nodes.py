@@ -17,6 +17,34 @@ class TestASTNode(unittest.TestCase):
         with self.assertRaises(TypeError):
             ASTNode()
 
+    def test_ast_nodes_use_slots(self):
+        """Test that AST nodes do not allocate a per-instance __dict__."""
+        nodes = [
+            CreateTableNode("users", [Column("id", "INT")]),
+            InsertNode("users", [1]),
+            SelectNode("users", ["*"]),
+            WhereClause("id", "=", 1),
+        ]
+
+        for node in nodes:
+            self.assertFalse(hasattr(node, '__dict__'), type(node).__name__)
+    
+    def test_ast_nodes_intern_names(self):
+        """Test that table and column names are interned at construction."""
+        table_name = "".join(["us", "ers"])
+        column_name = "".join(["a", "ge"])
+        
+        column = Column(column_name, "INT")
+        create = CreateTableNode(table_name, [column])
+        select = SelectNode(table_name, [column_name], WhereClause(column_name, ">", 1))
+        
+        self.assertIs(create.table_name, select.table_name)
+        self.assertIs(select.columns[0], select.where_clause.column)
+        
+        # The caller's Column objects are left untouched
+        self.assertIs(create.columns[0], column)
+        self.assertIs(column.name, column_name)
+
 
 class TestCreateTableNode(unittest.TestCase):
     """Test the CreateTableNode class."""
@@ -16,7 +16,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from mini_sql_engine.cli import SQLShell
 from mini_sql_engine.execution_engine import QueryResult
 from mini_sql_engine.models.row import Row
-from mini_sql_engine.exceptions import SQLEngineError, ParseError, TableNotFoundError
+from mini_sql_engine.exceptions import SQLEngineError, ParseError, TableNotFoundError, DataTypeError
 
 
 class TestCLIIntegration(unittest.TestCase):
@@ -162,6 +162,14 @@ class TestCLIIntegration(unittest.TestCase):
         result = self.shell.process_command(command)
         self.assertIn("Error:", result)
     
+    def test_error_label_for_error_subclass(self):
+        """Test that error subclasses use their parent's label."""
+        with patch.object(self.shell.engine, 'execute_plan',
+                          side_effect=DataTypeError("bad value")):
+            result = self.shell.process_command("SELECT * FROM users")
+        
+        self.assertEqual(result, "Validation Error: bad value")
+    
     def test_display_results_method(self):
         """Test the display_results method."""
         # Create a QueryResult with data
@@ -306,6 +314,28 @@ class TestCLIIntegration(unittest.TestCase):
         self.assertNotIn("Sales", results[6])
         self.assertIn("(2 rows)", results[6])
     
+    def test_run_script(self):
+        """Test executing piped commands without prompts."""
+        script = io.StringIO(
+            "CREATE TABLE test (id INT)\n"
+            "\n"
+            "INSERT INTO test VALUES (1)\n"
+            "SELECT * FROM test\n"
+            "exit\n"
+            "SELECT * FROM test\n"
+        )
+        output = io.StringIO()
+        
+        self.shell.run_script(script, output)
+        
+        result = output.getvalue()
+        self.assertNotIn("sql>", result)
+        self.assertNotIn("Mini SQL Engine", result)
+        self.assertIn("Table 'test' created successfully", result)
+        self.assertEqual(result.count("(1 row)"), 1)
+        self.assertTrue(result.endswith("Goodbye!\n"))
+        self.assertFalse(self.shell.running)
+    
     def test_data_directory_initialization(self):
         """Test SQLShell initialization with data directory."""
         shell = SQLShell(data_directory="/tmp/test_data")
@@ -318,6 +348,21 @@ class TestCLIIntegration(unittest.TestCase):
         self.shell.stop()
         self.assertFalse(self.shell.running)
 
+    def test_plan_cache_reuses_plans(self):
+        """Test that repeated commands skip parsing and see new data."""
+        self.shell.process_command("CREATE TABLE users (id INT, name VARCHAR)")
+        self.shell.process_command("INSERT INTO users VALUES (1, 'Alice')")
+
+        first = self.shell.process_command("SELECT * FROM users")
+        self.shell.process_command("INSERT INTO users VALUES (2, 'Bob')")
+
+        with patch.object(self.shell.engine.parser, 'parse') as mock_parse:
+            second = self.shell.process_command("SELECT * FROM users")
+            mock_parse.assert_not_called()
+
+        self.assertIn("(1 row)", first)
+        self.assertIn("Bob", second)
+        self.assertIn("(2 rows)", second)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
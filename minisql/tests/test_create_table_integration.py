@@ -47,6 +47,31 @@ class TestCreateTableIntegration(unittest.TestCase):
         assert table_info['column_count'] == 3
         assert table_info['columns'] == ['id', 'name', 'age']
     
+    def test_recreated_table_gets_fresh_schema(self):
+        """Test re-running a CREATE after a DROP does not reuse the old table's schema."""
+        sql = "CREATE TABLE t (id INT, name VARCHAR(20))"
+        self.sql_engine.execute_sql(sql)
+        storage = self.sql_engine.storage_manager
+        old_schema = storage.get_table_schema('t')
+        storage.get_table('t').insert_many([[i, f"name{i}"] for i in range(1000)])
+        self.assertFalse(old_schema.columns[1].dictionary_encoded)
+        
+        storage.drop_table('t')
+        self.sql_engine.execute_sql(sql)
+        
+        new_schema = storage.get_table_schema('t')
+        self.assertIsNot(new_schema, old_schema)
+        self.assertEqual(new_schema, old_schema)
+        self.assertTrue(new_schema.columns[1].dictionary_encoded)
+        
+        # A prepared CREATE plan run again also starts from a clean schema
+        plan = self.sql_engine.prepare("CREATE TABLE u (id INT)")
+        self.sql_engine.execute_plan(plan)
+        first = storage.get_table_schema('u')
+        storage.drop_table('u')
+        self.sql_engine.execute_plan(plan)
+        self.assertIsNot(storage.get_table_schema('u'), first)
+    
     def test_create_table_with_various_data_types(self):
         """Test CREATE TABLE with different data types."""
         sql = "CREATE TABLE products (id INT, name VARCHAR(100), price FLOAT, active BOOLEAN)"
@@ -191,6 +216,16 @@ class TestCreateTableComponents(unittest.TestCase):
         assert isinstance(operation.schema, Schema)
         assert len(operation.schema.columns) == 2
     
+    def test_query_processor_create_table_invalid_schema(self):
+        """Test an invalid schema is reported as a processing error."""
+        processor = QueryProcessor()
+        node = CreateTableNode('users', [Column('id', 'INT'), Column('ID', 'INT')])
+        
+        with self.assertRaises(ProcessingError) as context:
+            processor.visit_create_table(node)
+        
+        assert "Failed to process CREATE TABLE for 'users'" in str(context.exception)
+    
     def test_execution_engine_create_table(self):
         """Test execution engine executes CREATE TABLE operation."""
         storage = StorageManager()
@@ -35,6 +35,13 @@ class TestExceptionClasses(unittest.TestCase):
         self.assertEqual(str(error), "Test error")
         self.assertEqual(error.message, "Test error")
         self.assertEqual(error.context, {"key": "value"})
+        
+        # Context stays assignable, including on subclasses with derived context
+        error.context = {"other": 1}
+        self.assertEqual(error.context, {"other": 1})
+        parse_error = ParseError("Bad", sql="SELECT")
+        parse_error.context = {}
+        self.assertEqual(parse_error.context, {})
     
     def test_parse_error_with_context(self):
         """Test ParseError with SQL context."""
@@ -82,6 +89,16 @@ class TestExceptionClasses(unittest.TestCase):
         self.assertEqual(error.actual_type, "STRING")
         self.assertEqual(error.value, "abc")
         self.assertEqual(error.column_name, "age")
+        self.assertEqual(error.context, {
+            "column_name": "age", "value": "abc",
+            "expected_type": "INT", "actual_type": "STRING"
+        })
+    
+    def test_context_omits_missing_fields(self):
+        """Test that context only includes fields that were provided."""
+        error = ExecutionError("Execution failed", operation_type="ScanOperation")
+        self.assertEqual(error.context, {"operation_type": "ScanOperation"})
+        self.assertEqual(SQLEngineError("Plain error").context, {})
 
 
 class TestParserErrorHandling(unittest.TestCase):
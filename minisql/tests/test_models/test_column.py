@@ -185,6 +185,72 @@ class TestColumn(unittest.TestCase):
         # Non-nullable column
         with self.assertRaises(ValueError):
             col_not_nullable.convert_value(None)
+    
+    def test_convert_values(self):
+        """Test converting a whole column of values."""
+        col = Column("test", "INT")
+        
+        self.assertEqual(col.convert_values(["1", 2, 3.0]), [1, 2, 3])
+        self.assertEqual(col.convert_values((1, None)), [1, None])
+        self.assertEqual(col.convert_values([]), [])
+        
+        # Values already of the stored type are copied, not converted
+        values = [1, 2, 3]
+        self.assertEqual(col.convert_values(values), values)
+        self.assertIsNot(col.convert_values(values), values)
+        self.assertEqual(col.convert_values([True, 2]), [1, 2])
+        self.assertIs(type(col.convert_values([True, 2])[0]), int)
+        self.assertEqual(Column("f", "FLOAT").convert_values([1.5, 2]), [1.5, 2.0])
+        
+        # Errors name the offending value, as convert_value does
+        with self.assertRaisesRegex(ValueError, "Cannot convert value 2.5"):
+            col.convert_values([1, 2.5])
+        with self.assertRaises(ValueError):
+            Column("test", "INT", nullable=False).convert_values([1, None])
+    
+    def test_convert_varchar_shares_repeated_values(self):
+        """Test repeated short VARCHAR values are stored as one string object."""
+        col = Column("status", "VARCHAR")
+        
+        first = col.convert_value("".join(["act", "ive"]))
+        second = col.convert_value("".join(["ac", "tive"]))
+        
+        self.assertEqual(first, "active")
+        self.assertIs(first, second)
+        
+        # Batches share through the same dictionary
+        batch = col.convert_values(["".join(["acti", "ve"]), "x" * 100, "new", "new"])
+        self.assertEqual(batch, ["active", "x" * 100, "new", "new"])
+        self.assertIs(batch[0], first)
+        self.assertIs(batch[2], batch[3])
+        self.assertNotIn("x" * 100, col._dictionary)
+        
+        with self.assertRaises(ValueError):
+            Column("code", "VARCHAR", max_length=2).convert_values(["ok", "long"])
+    
+    def test_set_dictionary_encoding(self):
+        """Test turning VARCHAR value sharing off and back on."""
+        col = Column("code", "VARCHAR")
+        self.assertTrue(col.dictionary_encoded)
+        self.assertFalse(Column("id", "INT").dictionary_encoded)
+        
+        col.set_dictionary_encoding(False)
+        self.assertFalse(col.dictionary_encoded)
+        first = col.convert_value("".join(["a", "b"]))
+        self.assertIsNot(col.convert_value("".join(["a", "b"])), first)
+        self.assertEqual(col.convert_values(["ab", "cd"]), ["ab", "cd"])
+        
+        col.set_dictionary_encoding(True)
+        first = col.convert_value("".join(["a", "b"]))
+        self.assertIs(col.convert_value("".join(["a", "b"])), first)
+    
+    def test_type_handlers_hidden_from_repr_and_equality(self):
+        """Test the per-type handlers do not leak into repr or equality."""
+        col = Column("id", "INT")
+        
+        self.assertEqual(repr(col), "Column(name='id', data_type='INT', nullable=True, max_length=None)")
+        self.assertEqual(col, Column("id", "INT"))
+        self.assertNotEqual(col, Column("id", "FLOAT"))
 
 
 if __name__ == '__main__':
@@ -27,6 +27,12 @@ class TestRow(unittest.TestCase):
         self.assertEqual(len(self.row), 4)
         self.assertEqual(self.row.values, [1, "test", 3.14, True])
     
+    def test_row_takes_ownership_of_values(self):
+        """Test that a row keeps the given list and converts other sequences."""
+        values = [1, "test"]
+        self.assertIs(Row(values).values, values)
+        self.assertEqual(Row((1, "test")).values, [1, "test"])
+    
     def test_get_value(self):
         """Test getting value by index."""
         self.assertEqual(self.row.get_value(0), 1)
@@ -93,6 +99,11 @@ class TestRow(unittest.TestCase):
         self.assertEqual(projected.values, [1, 3.14])
         self.assertEqual(len(projected), 2)
     
+    def test_row_uses_slots(self):
+        """Test that rows do not allocate a per-instance __dict__."""
+        self.assertFalse(hasattr(self.row, '__dict__'))
+        self.assertFalse(hasattr(self.row.project([0]), '__dict__'))
+    
     def test_project_by_names(self):
         """Test projecting columns by name."""
         projected = self.row.project_by_names(["name", "active"], self.schema)
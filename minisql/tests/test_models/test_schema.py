@@ -64,6 +64,17 @@ class TestSchema(unittest.TestCase):
         with self.assertRaises(ValidationError):
             self.schema.get_column_index("nonexistent")
     
+    def test_get_column_index_remembers_spelling(self):
+        """Test that a case-insensitive match is remembered under its spelling."""
+        self.assertNotIn("NAME", self.schema._column_index_exact)
+        self.assertEqual(self.schema.get_column_index("NAME"), 1)
+        self.assertEqual(self.schema._column_index_exact["NAME"], 1)
+        self.assertEqual(self.schema.get_column_by_name("NAME").name, "name")
+        
+        with self.assertRaises(ValidationError):
+            self.schema.get_column_index("nonexistent")
+        self.assertNotIn("nonexistent", self.schema._column_index_exact)
+    
     def test_validate_row_valid(self):
         """Test validating valid rows."""
         # Valid row
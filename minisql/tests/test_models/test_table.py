@@ -61,6 +61,23 @@ class TestTable(unittest.TestCase):
         row = self.table.get_row(1)
         self.assertEqual(row.values, [2, "test2", 2.71, False])
     
+    def test_insert_many(self):
+        """Test inserting a batch of rows column-at-a-time."""
+        self.table.insert_many([
+            [1, "test1", 3.14, True],
+            ["2", "test2", "2.71", "false"],
+        ])
+        
+        self.assertEqual(len(self.table), 2)
+        self.assertEqual(self.table.get_row(1).values, [2, "test2", 2.71, False])
+        
+        # An invalid row rejects the whole batch
+        with self.assertRaises(ValidationError):
+            self.table.insert_many([[3, "ok", 1.0, True], [None, "bad", 1.0, True]])
+        with self.assertRaises(ValidationError):
+            self.table.insert_many([[3, "short"]])
+        self.assertEqual(len(self.table), 2)
+    
     def test_insert_invalid_row(self):
         """Test inserting invalid rows."""
         # Wrong number of columns
@@ -92,6 +109,25 @@ class TestTable(unittest.TestCase):
         self.assertEqual(len(rows), 2)
         self.assertEqual(rows[0].values, [1, "test1", 3.14, True])
         self.assertEqual(rows[1].values, [2, "test2", 2.71, False])
+        
+        # Projected scans read only the named columns, in the given order
+        rows = list(self.table.scan(["active", "ID"]))
+        self.assertEqual([row.values for row in rows], [[True, 1], [False, 2]])
+    
+    def test_scan_columns(self):
+        """Test reading whole columns from columnar storage."""
+        self.table.insert_values([1, "test1", 3.14, True])
+        self.table.insert_values([2, "test2", None, False])
+        
+        columns = self.table.scan_columns(["ID", "price"])
+        self.assertEqual(columns, {"ID": [1, 2], "price": [3.14, None]})
+        
+        all_columns = self.table.scan_columns()
+        self.assertEqual(list(all_columns), ["id", "name", "price", "active"])
+        self.assertEqual(all_columns["active"], [True, False])
+        
+        with self.assertRaises(ValidationError):
+            self.table.scan_columns(["missing"])
     
     def test_get_row(self):
         """Test getting row by index."""
@@ -146,6 +182,86 @@ class TestTable(unittest.TestCase):
         # Filter by price
         expensive_rows = list(self.table.filter_rows(lambda row: row.values[2] > 15.0))
         self.assertEqual(len(expensive_rows), 2)
+        
+        # Test only the price column's values; rows are built for matches only
+        expensive_rows = list(self.table.filter_rows(lambda price: price > 15.0, "PRICE"))
+        self.assertEqual([row.values[0] for row in expensive_rows], [2, 3])
+        self.assertEqual(expensive_rows[0].values, [2, "test2", 20.0, False])
+        
+        # Projected results hold only the requested columns, whichever form the predicate takes
+        names = self.table.filter_rows(lambda price: price > 15.0, "price", ["name"])
+        self.assertEqual([row.values for row in names], [["test2"], ["test3"]])
+        names = self.table.filter_rows(lambda row: row.values[3], projection=["name", "id"])
+        self.assertEqual([row.values for row in names], [["test1", 1], ["test3", 3]])
+        
+        with self.assertRaises(ValidationError):
+            self.table.filter_rows(lambda row: True, projection=["missing"])
+    
+    def test_count(self):
+        """Test counting rows with and without a predicate."""
+        self.assertEqual(self.table.count(), 0)
+        
+        self.table.insert_values([1, "test1", 10.0, True])
+        self.table.insert_values([2, "test2", 20.0, False])
+        self.table.insert_values([3, "test3", 30.0, True])
+        
+        self.assertEqual(self.table.count(), 3)
+        self.assertEqual(self.table.count(lambda row: row.values[3]), 2)
+        self.assertEqual(self.table.count(lambda price: price > 15.0, "price"), 2)
+    
+    def test_equal_positions(self):
+        """Test equality lookups through the lazily built column index."""
+        self.table.insert_values([1, "a", 10.0, True])
+        self.table.insert_values([2, "b", 20.0, False])
+        self.table.insert_values([3, "a", 10.0, True])
+        
+        self.assertEqual(self.table.equal_positions(1, "a"), [0, 2])
+        self.assertEqual(self.table.equal_positions(1, "z"), [])
+        self.assertEqual(self.table.equal_positions(2, 10), [0, 2])
+        
+        # Rows appended later are added to the existing index
+        self.table.insert_many([[4, "a", 5.0, False]])
+        self.assertEqual(self.table.equal_positions(1, "a"), [0, 2, 3])
+        
+        self.table.clear()
+        self.assertEqual(self.table.equal_positions(1, "a"), [])
+    
+    def test_analyze(self):
+        """Test column profiling and the VARCHAR encoding it chooses."""
+        self.table.insert_many([[i, "same", None, i % 2 == 0] for i in range(10)])
+        
+        stats = self.table.analyze()
+        self.assertEqual(stats["id"], {'distinct': 10, 'nulls': 0, 'dictionary_encoded': False})
+        self.assertEqual(stats["price"]["nulls"], 10)
+        self.assertEqual(stats["price"]["distinct"], 0)
+        self.assertEqual(stats["active"]["distinct"], 2)
+        self.assertTrue(stats["name"]["dictionary_encoded"])
+        
+        # Mostly distinct text turns encoding off once the table grows past the threshold
+        self.table.insert_many([[i, f"name{i}", 1.0, True] for i in range(10, 1000)])
+        self.assertFalse(self.columns[1].dictionary_encoded)
+        self.assertEqual(self.table.lookup_rows("name", "name500", ["id"])[0].values, [500])
+    
+    def test_table_uses_slots(self):
+        """Test that tables and schemas do not allocate a per-instance __dict__."""
+        self.assertFalse(hasattr(self.table, '__dict__'))
+        self.assertFalse(hasattr(self.table.schema, '__dict__'))
+    
+    def test_lookup_rows(self):
+        """Test fetching rows through the equality index."""
+        self.table.insert_values([1, "a", 10.0, True])
+        self.table.insert_values([2, "b", 20.0, False])
+        self.table.insert_values([3, "a", 10.0, True])
+        
+        rows = self.table.lookup_rows("NAME", "a")
+        self.assertEqual([row.values for row in rows], [[1, "a", 10.0, True], [3, "a", 10.0, True]])
+        self.assertEqual(self.table.lookup_rows("id", 4), [])
+        
+        rows = self.table.lookup_rows("name", "a", ["price"])
+        self.assertEqual([row.values for row in rows], [[10.0], [10.0]])
+        
+        with self.assertRaises(ValidationError):
+            self.table.lookup_rows("missing", 1)
     
     def test_clear(self):
         """Test clearing table."""
@@ -41,7 +41,93 @@ class TestSQLParser(unittest.TestCase):
             self.parser.parse("DELETE FROM users")
         
         self.assertIn("Unsupported SQL command: DELETE", str(context.exception))
+    
+    def test_parse_unsupported_command_skips_tokenizing(self):
+        """Test that unsupported commands are rejected before tokenizing."""
+        self.parser._tokenize = None
+        with self.assertRaises(ParseError) as context:
+            self.parser.parse("  update users SET name = 'x'")
+        
+        self.assertIn("Unsupported SQL command: UPDATE", str(context.exception))
+    
+    def test_parse_command_uppercased_like_full_token(self):
+        """Test the leading command is uppercased whatever character it starts with."""
+        with self.assertRaisesRegex(ParseError, "Unsupported SQL command: _FOO\\."):
+            self.parser.parse("_foo bar")
+        
+        # A quoted command word dispatches like a bare one, and the rest is tokenized after it
+        node = self.parser.parse('"select" name FROM users WHERE id = 1')
+        self.assertIsInstance(node, SelectNode)
+        self.assertEqual(node.columns, ["name"])
+        self.assertEqual(node.where_clause.value, 1)
 
+    
+    def test_parse_caches_by_sql_text(self):
+        """Test that repeated SQL text returns the cached AST node."""
+        sql = "SELECT id FROM users WHERE id = 1"
+        node = self.parser.parse(sql)
+        
+        self.assertIs(self.parser.parse(sql), node)
+        self.assertIsNot(self.parser.parse(sql + " "), node)
+        
+        self.parser.clear_cache()
+        self.assertIsNot(self.parser.parse(sql), node)
+        
+        # CREATE TABLE nodes own their Column objects, so they are never shared
+        create = "CREATE TABLE users (id INT)"
+        self.assertIsNot(self.parser.parse(create).columns[0], self.parser.parse(create).columns[0])
+    
+    def test_parse_errors_do_not_depend_on_cache_state(self):
+        """Test malformed INSERTs fail the same way before and after similar ones parse."""
+        bad = [
+            "INSERT INTO users VALUES (",
+            "INSERT INTO users VALUES (1, 2",
+            "INSERT INTO users VALUES (1,)",
+            "INSERT INTO users VALUES ()",
+        ]
+        
+        def errors(parser):
+            messages = []
+            for sql in bad:
+                with self.assertRaises(ParseError) as context:
+                    parser.parse(sql)
+                messages.append(str(context.exception))
+            return messages
+        
+        cold = errors(SQLParser())
+        self.parser.parse("INSERT INTO users VALUES (1, 'Alice')")
+        self.assertEqual(errors(self.parser), cold)
+        self.assertIn("Invalid INSERT syntax", cold[0])
+    
+    def test_parse_cache_is_bounded(self):
+        """Test that the least recently used entries are evicted."""
+        self.parser._parse_cache_max = 2
+        first = self.parser.parse("SELECT a FROM t")
+        self.parser.parse("SELECT b FROM t")
+        self.parser.parse("SELECT a FROM t")
+        self.parser.parse("SELECT c FROM t")
+        
+        self.assertEqual(list(self.parser._parse_cache), ["SELECT a FROM t", "SELECT c FROM t"])
+        self.assertIs(self.parser.parse("SELECT a FROM t"), first)
+    
+    def test_parse_errors_are_not_cached(self):
+        """Test that SQL that fails to parse is not cached."""
+        with self.assertRaises(ParseError):
+            self.parser.parse("DELETE FROM users")
+        
+        self.assertEqual(len(self.parser._parse_cache), 0)
+    
+    def test_parse_wraps_unexpected_statement_errors(self):
+        """Test that unexpected errors name the statement being parsed."""
+        def fail(tokens):
+            raise RuntimeError("boom")
+        self.parser._parse_select_columns = fail
+        
+        with self.assertRaises(ParseError) as context:
+            self.parser.parse("SELECT id FROM users")
+        
+        self.assertEqual(str(context.exception), "Error parsing SELECT statement: boom")
+        self.assertEqual(context.exception.sql, "SELECT id FROM users")
 
 class TestSQLParserTokenization(unittest.TestCase):
     """Test the tokenization functionality of SQLParser."""
@@ -85,6 +171,19 @@ class TestSQLParserTokenization(unittest.TestCase):
         tokens = self.parser._tokenize("SELECT * FROM users WHERE age >= 18 AND status != 'inactive'")
         expected = ["SELECT", "*", "FROM", "users", "WHERE", "age", ">=", "18", "AND", "status", "!=", "inactive"]
         self.assertEqual(tokens, expected)
+    
+    def test_tokenize_with_escaped_quotes(self):
+        """Test that doubled quotes inside quoted strings are unescaped."""
+        tokens = self.parser._tokenize('INSERT INTO t VALUES (\'O\'\'Brien\', "say ""hi""")')
+        expected = ["INSERT", "INTO", "t", "VALUES", "(", "O'Brien", ",", 'say "hi"', ")"]
+        self.assertEqual(tokens, expected)
+    
+    def test_tokenize_long_quoted_string(self):
+        """Test tokenizing a long quoted string containing escaped quotes."""
+        text = "a" * 5000 + "''" + "b" * 5000
+        tokens = self.parser._tokenize(f"INSERT INTO t VALUES ('{text}')")
+        self.assertEqual(tokens[5], "a" * 5000 + "'" + "b" * 5000)
+        self.assertEqual(tokens[6], ")")
 
 
 class TestSQLParserCreateTable(unittest.TestCase):
@@ -106,6 +205,10 @@ class TestSQLParserCreateTable(unittest.TestCase):
         self.assertEqual(node.columns[0].data_type, "INT")
         self.assertEqual(node.columns[1].name, "name")
         self.assertEqual(node.columns[1].data_type, "VARCHAR")
+        
+        # Column names are interned like the names in SELECT nodes
+        select = self.parser.parse("SELECT name FROM users")
+        self.assertIs(node.columns[1].name, select.columns[0])
     
     def test_parse_create_table_with_varchar_length(self):
         """Test parsing CREATE TABLE with VARCHAR length specification."""
@@ -144,6 +247,39 @@ class TestSQLParserCreateTable(unittest.TestCase):
             with self.assertRaises(ParseError):
                 self.parser.parse(sql)
     
+    def test_parse_create_table_identifier_validation(self):
+        """Test that names need at least one letter or digit."""
+        node = self.parser.parse("CREATE TABLE _users (_id INT)")
+        self.assertEqual(node.table_name, "_users")
+        self.assertEqual(node.columns[0].name, "_id")
+        
+        with self.assertRaises(ParseError) as context:
+            self.parser.parse("CREATE TABLE __ (id INT)")
+        self.assertIn("Invalid table name: '__'", str(context.exception))
+        
+        node = self.parser.parse('CREATE TABLE "order-items" (id INT)')
+        self.assertEqual(node.table_name, "order-items")
+    
+    def test_parse_create_table_duplicate_columns(self):
+        """Test that duplicate column names are reported once each, in order."""
+        with self.assertRaises(ParseError) as context:
+            self.parser.parse("CREATE TABLE t (a INT, b INT, A INT, b INT, a INT)")
+        
+        self.assertIn("Duplicate column names found: a, b", str(context.exception))
+    
+    def test_parse_create_table_empty_column_definitions(self):
+        """Test that missing column definitions between commas are rejected."""
+        cases = [
+            ("CREATE TABLE t (a INT,, b INT)", "empty column after comma"),
+            ("CREATE TABLE t (, a INT)", "empty column after comma"),
+            ("CREATE TABLE t (a INT,)", "trailing comma in column list"),
+        ]
+        
+        for sql, message in cases:
+            with self.assertRaises(ParseError) as context:
+                self.parser.parse(sql)
+            self.assertIn(message, str(context.exception))
+    
     def test_parse_create_table_missing_parentheses(self):
         """Test parsing CREATE TABLE with missing parentheses."""
         with self.assertRaises(ParseError) as context:
@@ -190,6 +326,20 @@ class TestSQLParserInsert(unittest.TestCase):
         self.assertEqual(node.values[3], True)
         self.assertIsNone(node.values[4])
     
+    def test_parse_insert_multi_token_value(self):
+        """Test that a value spanning several tokens is rejected."""
+        with self.assertRaises(ParseError) as context:
+            self.parser.parse("INSERT INTO users VALUES (1, John Smith)")
+        
+        self.assertIn("Each value must be a single token", str(context.exception))
+    
+    def test_parse_insert_nested_parentheses(self):
+        """Test that the VALUES list ends at the matching closing parenthesis."""
+        with self.assertRaises(ParseError) as context:
+            self.parser.parse("INSERT INTO users VALUES (1, (2), 3)")
+        
+        self.assertIn("Invalid value: '( 2 )'", str(context.exception))
+    
     def test_parse_insert_boolean_values(self):
         """Test parsing INSERT with boolean values."""
         sql = "INSERT INTO settings VALUES (TRUE, FALSE)"
@@ -247,6 +397,17 @@ class TestSQLParserSelect(unittest.TestCase):
         self.assertEqual(node.columns, ["*"])
         self.assertIsNone(node.where_clause)
     
+    def test_parse_select_count(self):
+        """Test parsing SELECT COUNT(*) statement."""
+        node = self.parser.parse("select count(*) from users where age > 3")
+        
+        self.assertIsInstance(node, SelectNode)
+        self.assertEqual(node.columns, ["COUNT(*)"])
+        self.assertEqual(node.where_clause.column, "age")
+        
+        with self.assertRaises(ParseError):
+            self.parser.parse("SELECT COUNT(id) FROM users")
+    
     def test_parse_select_specific_columns(self):
         """Test parsing SELECT with specific columns."""
         sql = "SELECT id, name, email FROM users"
@@ -257,6 +418,15 @@ class TestSQLParserSelect(unittest.TestCase):
         self.assertEqual(node.columns, ["id", "name", "email"])
         self.assertIsNone(node.where_clause)
     
+    def test_parse_select_lowercase_keywords(self):
+        """Test that SELECT keywords are matched case-insensitively."""
+        node = self.parser.parse("select name from users where name = 'from'")
+        
+        self.assertEqual(node.table_name, "users")
+        self.assertEqual(node.columns, ["name"])
+        self.assertEqual(node.where_clause.column, "name")
+        self.assertEqual(node.where_clause.value, "from")
+    
     def test_parse_select_with_where(self):
         """Test parsing SELECT with WHERE clause."""
         sql = "SELECT * FROM users WHERE age > 18"
@@ -4,6 +4,7 @@ Tests result formatting, display utilities, and various data types.
 """
 
 import unittest
+import io
 import json
 from mini_sql_engine.execution_engine import QueryResult
 from mini_sql_engine.models.row import Row
@@ -253,6 +254,36 @@ class TestQueryResult(unittest.TestCase):
         result = QueryResult(columns=["id", "name"])
         self.assertEqual(result.to_csv(), "")
     
+    def test_from_columns_matches_row_result(self):
+        """Test a column-backed result formats like a row-backed one and builds rows lazily."""
+        columns = ["id", "name", "score"]
+        by_rows = QueryResult(columns=columns, rows=[Row([1, "Alice", 9.5]), Row([2, None, 7.0])])
+        by_columns = QueryResult.from_columns(columns, [[1, 2], ["Alice", None], [9.5, 7.0]])
+        
+        self.assertEqual(by_columns.get_row_count(), 2)
+        self.assertEqual(by_columns.to_string(), by_rows.to_string())
+        self.assertEqual(by_columns.to_csv(), by_rows.to_csv())
+        self.assertEqual(by_columns.to_json(), by_rows.to_json())
+        self.assertEqual(by_columns._rows, [])  # Rows not built yet
+        
+        self.assertEqual(by_columns.rows, by_rows.rows)
+    
+    def test_write_csv_streams_to_file(self):
+        """Test write_csv writes header and rows to a file object."""
+        result = QueryResult(columns=["id", "note"], rows=[Row([1, "a\nb"]), Row([2, None])])
+        buffer = io.StringIO()
+        result.write_csv(buffer)
+        
+        self.assertEqual(buffer.getvalue(), 'id,note\n1,"a\nb"\n2,NULL\n')
+    
+    def test_iter_json_records(self):
+        """Test iter_json_records yields one dict per row lazily."""
+        result = QueryResult(columns=["id", "name"], rows=[Row([1, "Alice"]), Row([2, "Bob"])])
+        records = result.iter_json_records()
+        
+        self.assertEqual(next(records), {"id": 1, "name": "Alice"})
+        self.assertEqual(list(records), [{"id": 2, "name": "Bob"}])
+    
     def test_to_json_format(self):
         """Test to_json method."""
         columns = ["id", "name", "active"]
@@ -112,6 +112,156 @@ class TestSelectComponents(unittest.TestCase):
         self.assertEqual(result.rows[1].values, [2, 'Bob'])
         self.assertEqual(result.rows[2].values, [3, 'Charlie'])
     
+    def test_execution_engine_select_filtered_projection(self):
+        """Test execution engine gathers only selected rows of projected columns."""
+        sql = "SELECT name, id FROM users WHERE active = TRUE"
+        node = self.parser.parse(sql)
+        plan = self.processor.process(node)
+        result = self.engine.execute(plan)
+        
+        self.assertEqual(result.columns, ['name', 'id'])
+        self.assertEqual([row.values for row in result.rows], [['Alice', 1], ['Charlie', 3]])
+    
+    def test_execution_engine_caches_select_results(self):
+        """Test repeated SELECTs reuse results until the table changes."""
+        plan = self.processor.process(self.parser.parse("SELECT * FROM users WHERE age > 26"))
+        
+        first = self.engine.execute(plan)
+        second = self.engine.execute(plan)
+        
+        # Hits share the cached columns but never the result object
+        self.assertIsNot(second, first)
+        self.assertIs(second._column_data, first._column_data)
+        first.rows.append(first.rows[0])
+        first.columns.append('zzz')
+        third = self.engine.execute(plan)
+        self.assertEqual(len(third.rows), 2)
+        self.assertEqual(third.columns, ['id', 'name', 'age', 'active'])
+        self.assertIsNot(third.columns, second.columns)
+        
+        self.storage.insert_values("users", [4, 'Diana', 40, False])
+        refreshed = self.engine.execute(plan)
+        refreshed_columns = refreshed._column_data
+        
+        # Streaming rows leaves the result columnar
+        self.assertEqual([row.values[0] for row in refreshed.iter_rows()], [2, 3, 4])
+        self.assertIs(refreshed._column_data, refreshed_columns)
+        
+        self.assertEqual(len(refreshed.rows), 3)
+        self.assertEqual(list(refreshed.iter_rows()), refreshed.rows)
+        
+        # The outdated result was replaced, not kept alongside the new one
+        self.assertEqual(len(self.engine._result_cache), 1)
+        
+        self.engine.clear_cache()
+        self.assertIsNot(self.engine.execute(plan)._column_data, refreshed_columns)
+    
+    def test_project_operation_resolves_indices_once(self):
+        """Test projection indices are resolved once per schema, including SELECT *."""
+        from mini_sql_engine.query_processor import ProjectOperation
+        
+        schema = self.storage.get_table("users").schema
+        star = ProjectOperation(['*'])
+        named = ProjectOperation(['age', 'id'])
+        
+        self.assertEqual(star.column_indices(schema), [0, 1, 2, 3])
+        indices = named.column_indices(schema)
+        self.assertEqual(indices, [2, 0])
+        self.assertIs(named.column_indices(schema), indices)
+        
+        with self.assertRaises(ColumnNotFoundError):
+            ProjectOperation(['missing']).column_indices(schema, "users")
+    
+    def test_project_operation_execute_rows(self):
+        """Test projecting rows directly, for one and several columns."""
+        from mini_sql_engine.query_processor import ProjectOperation
+        
+        rows = list(self.storage.scan_table("users"))
+        single = ProjectOperation(['name']).execute(self.storage, input_rows=rows, table_name="users")
+        several = ProjectOperation(['age', 'id']).execute(self.storage, input_rows=rows, table_name="users")
+        
+        self.assertEqual([row.values for row in single], [['Alice'], ['Bob'], ['Charlie']])
+        self.assertEqual([row.values for row in several], [[25, 1], [30, 2], [35, 3]])
+    
+    def test_execute_operation_returns_scanned_rows(self):
+        """Test a row-producing operation executed alone yields a data result."""
+        from mini_sql_engine.query_processor import ScanOperation
+        
+        result = self.engine.execute_operation(ScanOperation("users"))
+        
+        self.assertIsNone(result.message)
+        self.assertEqual(len(result.rows), 3)
+        self.assertEqual(result.rows[0].values, [1, 'Alice', 25, True])
+    
+    def test_plans_and_operations_use_slots(self):
+        """Test plan objects carry no per-instance attribute dict."""
+        plan = self.processor.process(self.parser.parse("SELECT id FROM users WHERE age > 1"))
+        
+        for obj in [plan] + plan.get_operations():
+            with self.subTest(obj=obj):
+                self.assertFalse(hasattr(obj, '__dict__'))
+    
+    def test_scan_operation_streams_rows(self):
+        """Test a row scan is lazy and yields every row in order."""
+        from mini_sql_engine.query_processor import ScanOperation
+        
+        rows = ScanOperation("users").execute(self.storage)
+        
+        self.assertIs(iter(rows), rows)
+        self.assertEqual(next(rows).values, [1, 'Alice', 25, True])
+        self.assertEqual([row.values[0] for row in rows], [2, 3])
+    
+    def test_scan_operation_batches_columns(self):
+        """Test a batched scan yields the requested columns in row order."""
+        from mini_sql_engine.query_processor import ScanOperation
+        
+        batches = list(ScanOperation("users").execute_batched(self.storage, [2, 0], batch_size=2))
+        
+        self.assertEqual([batch.num_rows for batch in batches], [2, 1])
+        self.assertEqual(batches[0].columns, [[25, 30], [1, 2]])
+        self.assertEqual(batches[1].columns, [[35], [3]])
+        self.assertEqual([batch.offset for batch in batches], [0, 2])
+    
+    def test_select_spanning_several_batches(self):
+        """Test a filtered projection gathers rows correctly across batch boundaries."""
+        from mini_sql_engine.query_processor import BATCH_SIZE
+        
+        total = BATCH_SIZE * 2 + 10
+        self.storage.get_table("users").insert_many(
+            [[i, f'user{i}', i % 7, i % 2 == 0] for i in range(4, total)]
+        )
+        
+        plan = self.processor.process(self.parser.parse("SELECT id FROM users WHERE age = 3"))
+        result = self.engine.execute(plan)
+        expected = [i for i in range(4, total) if i % 7 == 3]
+        self.assertEqual([row.values[0] for row in result.rows], expected)
+        
+        plan = self.processor.process(self.parser.parse("SELECT id, age FROM users WHERE age >= 0"))
+        result = self.engine.execute(plan)
+        self.assertEqual(result.get_row_count(), total - 1)
+        self.assertEqual(result.rows[-1].values, [total - 1, (total - 1) % 7])
+        
+        # A batch with a single matching row
+        plan = self.processor.process(self.parser.parse("SELECT name, id FROM users WHERE id <= 1"))
+        result = self.engine.execute(plan)
+        self.assertEqual([row.values for row in result.rows], [['Alice', 1]])
+        
+        # Projecting only the WHERE column keeps the matching values directly
+        plan = self.processor.process(self.parser.parse("SELECT id FROM users WHERE id > 5"))
+        result = self.engine.execute(plan)
+        self.assertEqual([row.values[0] for row in result.rows], list(range(6, total)))
+        
+        # Conditions that can never match return no rows without a scan
+        plan = self.processor.process(self.parser.parse("SELECT id, name FROM users WHERE age < NULL"))
+        self.assertEqual(self.engine.execute(plan).get_row_count(), 0)
+        
+        # Equality filters use the hash index, which follows later inserts
+        plan = self.processor.process(self.parser.parse("SELECT id FROM users WHERE age = 5"))
+        expected = [i for i in range(4, total) if i % 7 == 5]
+        self.assertEqual([row.values[0] for row in self.engine.execute(plan).rows], expected)
+        self.storage.get_table("users").insert_many([[total, 'late', 5, True]])
+        self.assertEqual([row.values[0] for row in self.engine.execute(plan).rows], expected + [total])
+    
     def test_storage_manager_scan_direct(self):
         """Test storage manager scans table correctly."""
         rows = list(self.storage.scan_table("users"))
@@ -282,6 +432,25 @@ class TestSelectIntegration(unittest.TestCase):
         self.assertEqual(result.columns, ['id', 'name'])
         self.assertEqual(len(result.rows), 0)
     
+    def test_select_count(self):
+        """Test SELECT COUNT(*) with and without a WHERE clause."""
+        cases = [
+            ("SELECT COUNT(*) FROM employees", 4),
+            ("SELECT COUNT(*) FROM employees WHERE salary > 55000.0", 2),
+            ("SELECT COUNT(*) FROM employees WHERE active = true", 3),
+            ("SELECT COUNT(*) FROM employees WHERE name = 'Nobody'", 0),
+            ("SELECT COUNT(*) FROM employees WHERE id < NULL", 0),
+        ]
+        
+        for sql, expected in cases:
+            with self.subTest(sql=sql):
+                result = self.sql_engine.execute_sql(sql)
+                self.assertEqual(result.columns, ['COUNT(*)'])
+                self.assertEqual([row.values for row in result.rows], [[expected]])
+        
+        with self.assertRaises(ColumnNotFoundError):
+            self.sql_engine.execute_sql("SELECT COUNT(*) FROM employees WHERE missing = 1")
+    
     def test_select_case_insensitive(self):
         """Test that SELECT is case insensitive."""
         test_cases = [
@@ -314,6 +483,43 @@ class TestSelectIntegration(unittest.TestCase):
                 self.assertTrue(result.is_data_result())
                 self.assertGreater(len(result.rows), 0)
     
+    def test_result_columns_do_not_alias_cached_plan(self):
+        """Test editing a result's column names leaves the cached plan untouched."""
+        sql = "SELECT id, name FROM employees"
+        self.sql_engine.execute_sql(sql).columns.append('zzz')
+        
+        # A new row forces the SELECT to be recomputed from the cached plan
+        self.sql_engine.execute_sql("INSERT INTO employees VALUES (5, 'Eve', 70000.0, false)")
+        result = self.sql_engine.execute_sql(sql)
+        
+        self.assertEqual(result.columns, ['id', 'name'])
+        self.assertEqual(self.sql_engine.prepare(sql).operations[-1].columns, ['id', 'name'])
+    
+    def test_prepare_caches_plans(self):
+        """Test that repeated statements reuse the cached execution plan."""
+        sql = "SELECT name FROM employees;"
+        plan = self.sql_engine.prepare(sql)
+        self.assertIs(self.sql_engine.prepare(sql), plan)
+        self.assertIsNot(self.sql_engine.prepare("SELECT id FROM employees;"), plan)
+        
+        # Cached plans see rows inserted after they were prepared
+        before = len(self.sql_engine.execute_sql(sql).rows)
+        self.sql_engine.execute_sql("INSERT INTO employees VALUES (5, 'Eve', 70000.0, false);")
+        self.assertEqual(len(self.sql_engine.execute_sql(sql).rows), before + 1)
+        
+        self.sql_engine.clear_cache()
+        self.assertIsNot(self.sql_engine.prepare(sql), plan)
+    
+    def test_prepare_cache_is_bounded(self):
+        """Test that the plan cache evicts the least recently used plan."""
+        self.sql_engine.clear_cache()
+        self.sql_engine._plan_cache_max = 2
+        first = self.sql_engine.prepare("SELECT id FROM employees;")
+        self.sql_engine.prepare("SELECT name FROM employees;")
+        self.sql_engine.prepare("SELECT salary FROM employees;")
+        self.assertEqual(len(self.sql_engine._plan_cache), 2)
+        self.assertIsNot(self.sql_engine.prepare("SELECT id FROM employees;"), first)
+    
     def test_select_result_formatting(self):
         """Test SELECT result string formatting."""
         sql = "SELECT id, name FROM employees"
@@ -59,6 +59,12 @@ class TestStorageManager(unittest.TestCase):
         self.assertTrue(self.storage.table_exists('employees'))
         self.assertTrue(self.storage.table_exists('EMPLOYEES'))
         self.assertTrue(self.storage.table_exists('Employees'))
+        
+        table = self.storage.get_table('employees')
+        self.assertIs(self.storage.get_table('EMPLOYEES'), table)
+        self.assertEqual(table.name, 'Employees')
+        with self.assertRaises(TableNotFoundError):
+            self.storage.get_table(' employees')
     
     def test_create_duplicate_table(self):
         """Test creating duplicate table raises error."""
@@ -113,6 +119,23 @@ class TestStorageManager(unittest.TestCase):
         table = self.storage.get_table('employees')
         self.assertEqual(table.row_count, 1)
     
+    def test_insert_many(self):
+        """Test inserting a batch of rows."""
+        self.storage.create_table('employees', self.test_schema)
+        
+        self.storage.insert_many('employees', [[1, 'John Doe', 30, 50000.0], [2, 'Jane', None, None]])
+        self.assertEqual(self.storage.get_table_row_count('employees'), 2)
+        
+        # A bad row rejects the whole batch
+        with self.assertRaises(ValidationError):
+            self.storage.insert_many('employees', [[3, 'Bob', 35, 1.0], [4, 'Ann']])
+        with self.assertRaises(ValidationError):
+            self.storage.insert_many('employees', [[3, 'Bob', 35, 1.0], [None, 'Ann', 1, 1.0]])
+        self.assertEqual(self.storage.get_table_row_count('employees'), 2)
+        
+        with self.assertRaises(TableNotFoundError):
+            self.storage.insert_many('missing', [[1]])
+    
     def test_insert_invalid_row(self):
         """Test inserting invalid row raises error."""
         self.storage.create_table('employees', self.test_schema)
@@ -145,6 +168,36 @@ class TestStorageManager(unittest.TestCase):
         for i, row in enumerate(rows):
             self.assertEqual(row.values, test_data[i])
     
+    def test_filter_rows(self):
+        """Test lazily filtering table rows."""
+        self.storage.create_table('employees', self.test_schema)
+        self.storage.insert_values('employees', [1, 'John Doe', 30, 50000.0])
+        self.storage.insert_values('employees', [2, 'Jane Smith', 25, 45000.0])
+        
+        rows = self.storage.filter_rows('employees', lambda age: age < 28, 'age', ['name'])
+        self.assertEqual(next(rows).values, ['Jane Smith'])
+        self.assertEqual(list(rows), [])
+        
+        rows = self.storage.filter_rows('employees', lambda row: row.values[0] == 1)
+        self.assertEqual([row.values for row in rows], [[1, 'John Doe', 30, 50000.0]])
+    
+    def test_lookup_rows(self):
+        """Test equality lookups of table rows."""
+        self.storage.create_table('employees', self.test_schema)
+        self.storage.insert_values('employees', [1, 'John Doe', 30, 50000.0])
+        self.storage.insert_values('employees', [2, 'Jane Smith', 25, 45000.0])
+        
+        rows = self.storage.lookup_rows('employees', 'id', 2)
+        self.assertEqual([row.values for row in rows], [[2, 'Jane Smith', 25, 45000.0]])
+        
+        # Rows inserted after the first lookup are found too
+        self.storage.insert_values('employees', [3, 'Jane Smith', 40, 70000.0])
+        rows = self.storage.lookup_rows('employees', 'name', 'Jane Smith')
+        self.assertEqual([row.values[0] for row in rows], [2, 3])
+        
+        with self.assertRaises(TableNotFoundError):
+            self.storage.lookup_rows('missing', 'id', 1)
+    
     def test_get_table_schema(self):
         """Test getting table schema."""
         self.storage.create_table('employees', self.test_schema)
@@ -257,6 +310,17 @@ class TestStorageManagerPersistence(unittest.TestCase):
         for i, row in enumerate(rows):
             self.assertEqual(row.values, self.test_data[i])
     
+    def test_save_json_is_compact(self):
+        """Test that table JSON files are written without whitespace."""
+        self.storage.create_table('users', self.test_schema)
+        self.storage.insert_values('users', self.test_data[0])
+        
+        self.storage.save_table_to_json('users')
+        
+        text = (Path(self.temp_dir) / 'users.json').read_text(encoding='utf-8')
+        self.assertNotIn('\n', text)
+        self.assertIn('"rows":[[1,"John Doe",true]]', text)
+    
     def test_save_load_csv(self):
         """Test saving and loading table in CSV format."""
         # Create and populate table
@@ -321,6 +385,18 @@ class TestStorageManagerPersistence(unittest.TestCase):
         self.assertEqual(new_storage.get_table_row_count('users'), 1)
         self.assertEqual(new_storage.get_table_row_count('products'), 1)
     
+    def test_load_all_tables_json_skips_csv_schema_files(self):
+        """Test loading JSON tables ignores the schema files of CSV tables."""
+        self.storage.create_table('users', self.test_schema)
+        self.storage.create_table('products', self.test_schema)
+        self.storage.save_table_to_csv('users')
+        self.storage.save_table_to_json('products')
+        
+        new_storage = StorageManager(self.temp_dir)
+        new_storage.load_all_tables('json')
+        
+        self.assertEqual(new_storage.list_tables(), ['products'])
+    
     def test_persistence_without_data_directory(self):
         """Test persistence operations without data directory."""
         storage = StorageManager()  # No data directory
@@ -218,6 +218,89 @@ class TestWhereClauseEvaluation(unittest.TestCase):
         self.assertFalse(where_clause.evaluate("25"))
         self.assertFalse(where_clause.evaluate("old"))
 
+    def test_where_clause_compile_matches_evaluate(self):
+        """Test that compiled predicates agree with evaluate for every operator."""
+        samples = [None, 10, 18, 25, "25"]
+        for operator in WhereClause.VALID_OPERATORS:
+            for literal in (18, None):
+                where_clause = WhereClause("age", operator, literal)
+                predicate = where_clause.compile()
+                for value in samples:
+                    with self.subTest(operator=operator, literal=literal, value=value):
+                        self.assertEqual(predicate(value), where_clause.evaluate(value))
+
+    def test_where_clause_specialized_predicates(self):
+        """Test generated predicates are shared per operator and match generic ones."""
+        from decimal import Decimal
+        
+        first = WhereClause("age", "<", 30).compile()
+        second = WhereClause("score", "<", 2.5).compile()
+        generic = WhereClause("age", "<", Decimal(30)).compile()
+        
+        self.assertIs(first.__code__, second.__code__)
+        self.assertIsNot(first.__code__, generic.__code__)
+        for value in (None, 20, 30, 40, "x"):
+            with self.subTest(value=value):
+                self.assertEqual(first(value), generic(value))
+    
+    def test_where_clause_evaluate_mask(self):
+        """Test evaluating a WHERE clause over a whole column."""
+        where_clause = WhereClause("age", ">=", 25)
+
+        mask = where_clause.evaluate_mask([20, 25, None, 30, "old"])
+
+        self.assertEqual(mask, [False, True, False, True, False])
+        self.assertEqual(where_clause.evaluate_mask([]), [])
+    
+    def test_where_clause_select(self):
+        """Test selecting matching row positions from a column."""
+        cases = [
+            (WhereClause("name", ">", "b"), ["a", "c", None, "d", "b"]),
+            (WhereClause("name", "!=", "b"), ["a", None, "b"]),
+            (WhereClause("age", "<", 30), [20, "old", None, 40, 10]),
+            (WhereClause("age", ">=", 30), [20, 30, 45.5]),
+            (WhereClause("name", "=", None), ["a", None]),
+        ]
+        
+        for where_clause, column in cases:
+            with self.subTest(where_clause=where_clause):
+                mask = where_clause.evaluate_mask(column)
+                expected = [i for i, matched in enumerate(mask) if matched]
+                self.assertEqual(where_clause.select(column), expected)
+                self.assertEqual(where_clause.select(column, 100), [i + 100 for i in expected])
+                self.assertEqual(where_clause.filter_values(column), [column[i] for i in expected])
+                
+                # Columns without NULLs may skip the NULL test
+                not_null = [v for v in column if v is not None]
+                self.assertEqual(where_clause.select(not_null, 0, nullable=False), where_clause.select(not_null))
+                self.assertEqual(where_clause.filter_values(not_null, nullable=False),
+                                 where_clause.filter_values(not_null))
+    
+    def test_where_clause_select_null_literal(self):
+        """Test comparisons with NULL only test for NULL, or match nothing."""
+        column = [1, None, "a", None]
+        
+        for op in ['=', '>', '<', '>=', '<=', '!=', '<>']:
+            with self.subTest(op=op):
+                where_clause = WhereClause("age", op, None)
+                expected = [where_clause.evaluate(v) for v in column]
+                self.assertEqual(where_clause.evaluate_mask(column), expected)
+                self.assertEqual(where_clause.matches_nothing(), not any(expected))
+                self.assertEqual(where_clause.select(column, 10),
+                                 [i + 10 for i, matched in enumerate(expected) if matched])
+                self.assertEqual(where_clause.filter_values(column),
+                                 [v for v, matched in zip(column, expected) if matched])
+    
+    def test_where_clause_evaluate_mask_numeric(self):
+        """Test the generated column mask agrees with per-value evaluation."""
+        column = [20, 25.0, 30, -1, 25]
+        
+        for op in ['=', '>', '<', '>=', '<=', '!=', '<>']:
+            with self.subTest(op=op):
+                where_clause = WhereClause("age", op, 25)
+                expected = [where_clause.evaluate(v) for v in column]
+                self.assertEqual(where_clause.evaluate_mask(column), expected)
+
 
 class TestFilterOperation(unittest.TestCase):
     """Test FilterOperation functionality."""
@@ -308,6 +391,17 @@ class TestFilterOperation(unittest.TestCase):
         with self.assertRaises(ColumnNotFoundError):
             filter_op.execute(self.storage, input_rows=self.test_rows, table_name="users")
     
+    def test_filter_operation_column_index_cached(self):
+        """Test that the WHERE column index is resolved once per schema."""
+        filter_op = FilterOperation(WhereClause("AGE", ">", 25))
+        schema = self.storage.get_table("users").schema
+        
+        self.assertEqual(filter_op.column_index(schema, "users"), 2)
+        self.assertIs(filter_op._resolved[0], schema)
+        
+        result = filter_op.execute(self.storage, input_rows=self.test_rows, table_name="users")
+        self.assertEqual([row.values[0] for row in result], [2, 3])
+    
     def test_filter_operation_missing_input_rows(self):
         """Test FilterOperation with missing input rows."""
         where_clause = WhereClause("age", "=", 25)